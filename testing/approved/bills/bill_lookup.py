@@ -3,141 +3,276 @@
 Bill Lookup Tool - Query detailed information about specific bills.
 Usage: python bill_lookup.py C-11
        python bill_lookup.py S-2 C-11 C-234
+       python bill_lookup.py --json S-2 C-11
+       python bill_lookup.py --daemon C-11
+       python bill_lookup.py --build-shards
 """
 
+import bisect
+import heapq
+import io
+import json
+import re
 import sys
-from utils import load_bills, calculate_days_since
+from concurrent.futures import ThreadPoolExecutor
+from bill_lookup_daemon import query_daemon, start_daemon
+from utils import (
+    bill_shards_current,
+    build_bill_shards,
+    calculate_days_since,
+    list_bill_shards,
+    load_bill_shard,
+    load_bills,
+)
 
+# Last-activity freshness buckets: <= 30 days, <= 90 days, older
+_ACTIVITY_THRESHOLDS = (30, 90)
+_ACTIVITY_EMOJI = ("🟢", "🟡", "🔴")
 
-def display_bill(bill: dict):
-    """Display detailed information about a bill."""
+# House (C-) and Senate (S-) bill numbers, e.g. "C-11", "S-2"
+_BILL_ID_RE = re.compile(r"^[CS]-\d+$", re.IGNORECASE)
+
+_DOUBLE_BAR = "═" * 80
+_LIGHT_BAR = "─" * 80
+
+# Coming into Force emoji, keyed by both CIFStatus names and display values
+_CIF_EMOJI = {
+    "ACTIVE_ON_ASSENT": "✅",
+    "Active on Royal Assent": "✅",
+    "FIXED_DATE": "📅",
+    "Fixed Date": "📅",
+    "WAITING_FOR_ORDER": "⏳",
+    "Waiting for Order in Council": "⏳",
+}
+
+
+def render_bill(bill: dict) -> str:
+    """Render detailed information about a bill as display text.
+
+    Fields present in every load_bills() record (bill_id, title, session,
+    bill_type, history and each event's status fields) are read directly;
+    genuinely optional fields still go through .get().
+    """
     bill_id = bill["bill_id"]
+    out = io.StringIO()
 
-    print("\n" + "═" * 80)
-    print(f"  {bill_id}: {bill['title']}")
-    print("═" * 80)
+    print("\n" + _DOUBLE_BAR, file=out)
+    print(f"  {bill_id}: {bill['title']}", file=out)
+    print(_DOUBLE_BAR, file=out)
 
     # Basic info
-    print(f"\n📋 Basic Information:")
-    print(f"   Session:       {bill['session']}")
-    print(f"   Type:          {bill.get('bill_type', 'Unknown')}")
+    print(f"\n📋 Basic Information:", file=out)
+    print(f"   Session:       {bill['session']}", file=out)
+    print(f"   Type:          {bill['bill_type']}", file=out)
 
     # Lifecycle status
     if bill.get("died_on_order_paper"):
-        print(f"   Status:        ⚰️  DIED ON ORDER PAPER (session ended)")
+        print(f"   Status:        ⚰️  DIED ON ORDER PAPER (session ended)", file=out)
     elif bill.get("royal_assent_date"):
-        print(f"   Status:        ✅ BECAME LAW")
+        print(f"   Status:        ✅ BECAME LAW", file=out)
     elif bill.get("is_active", True):
-        print(f"   Status:        🔄 ACTIVE (in current parliament)")
+        print(f"   Status:        🔄 ACTIVE (in current parliament)", file=out)
     else:
-        print(f"   Status:        📋 HISTORICAL")
+        print(f"   Status:        📋 HISTORICAL", file=out)
 
     # Sponsor info
     if bill.get("sponsor"):
-        print(f"\n👤 Sponsorship:")
-        print(f"   Sponsor:       {bill['sponsor']}")
+        print(f"\n👤 Sponsorship:", file=out)
+        print(f"   Sponsor:       {bill['sponsor']}", file=out)
         if bill.get("has_royal_recommendation"):
-            print(f"   Royal Rec:     ✓ Yes (affects public funds)")
+            print(f"   Royal Rec:     ✓ Yes (affects public funds)", file=out)
         else:
-            print(f"   Royal Rec:     ✗ No")
+            print(f"   Royal Rec:     ✗ No", file=out)
 
     # Timeline info
-    print(f"\n⏱️  Timeline:")
+    print(f"\n⏱️  Timeline:", file=out)
 
     # Last activity
     if bill.get("last_activity_date"):
         days = calculate_days_since(bill["last_activity_date"])
         if days is not None:
-            status = "🟢" if days <= 30 else "🟡" if days <= 90 else "🔴"
-            print(f"   Last Activity: {status} {days} days ago")
+            status = _ACTIVITY_EMOJI[bisect.bisect_left(_ACTIVITY_THRESHOLDS, days)]
+            print(f"   Last Activity: {status} {days} days ago", file=out)
         else:
-            print(f"   Last Activity: {bill['last_activity_date']}")
+            print(f"   Last Activity: {bill['last_activity_date']}", file=out)
 
     # Royal assent
     if bill.get("royal_assent_date"):
         days = calculate_days_since(bill["royal_assent_date"])
-        print(f"   Royal Assent:  ✓ Received ({days} days ago)")
-        print(f"   Status:        🎉 BECAME LAW")
+        print(f"   Royal Assent:  ✓ Received ({days} days ago)", file=out)
+        print(f"   Status:        🎉 BECAME LAW", file=out)
 
         # Show chapter citation
         if bill.get("chapter_citation"):
-            print(f"   Chapter:       {bill['chapter_citation']}")
+            print(f"   Chapter:       {bill['chapter_citation']}", file=out)
 
         # Show Coming into Force status
         cif_status = bill.get("cif_status", "Not Determined")
-        cif_emoji = {
-            "ACTIVE_ON_ASSENT": "✅",
-            "Active on Royal Assent": "✅",
-            "FIXED_DATE": "📅",
-            "Fixed Date": "📅",
-            "WAITING_FOR_ORDER": "⏳",
-            "Waiting for Order in Council": "⏳",
-        }.get(cif_status, "❓")
-        print(f"   In Force:      {cif_emoji} {cif_status}")
+        cif_emoji = _CIF_EMOJI.get(cif_status, "❓")
+        print(f"   In Force:      {cif_emoji} {cif_status}", file=out)
 
         if bill.get("cif_details"):
             details = bill["cif_details"][:80]
-            print(f"   CIF Details:   {details}...")
+            print(f"   CIF Details:   {details}...", file=out)
     else:
-        print(f"   Royal Assent:  ⏳ Pending")
+        print(f"   Royal Assent:  ⏳ Pending", file=out)
 
     # History
-    history = bill.get("history", [])
+    history = bill["history"]
     if history:
-        print(f"\n📜 Status History ({len(history)} events):")
+        print(f"\n📜 Status History ({len(history)} events):", file=out)
         for i, event in enumerate(history, 1):
-            timestamp = (
-                event["timestamp"][:16].replace("T", " ")
-                if event.get("timestamp")
-                else "Unknown"
-            )
-            status = event.get("status_text", "Unknown")
-            chamber = event.get("chamber", "Unknown")
-            print(f"   {i}. [{timestamp}] {status}")
-            print(f"      Chamber: {chamber}")
+            try:
+                ts = event["timestamp"]
+            except KeyError:
+                ts = None
+            # ISO 8601: date in [:10], "T" at 10, HH:MM in [11:16]
+            timestamp = f"{ts[:10]} {ts[11:16]}" if ts else "Unknown"
+            status = event["status_text"]
+            chamber = event["chamber"]
+            print(f"   {i}. [{timestamp}] {status}", file=out)
+            print(f"      Chamber: {chamber}", file=out)
 
     # Current status
     if history:
         current = history[-1]
-        print(f"\n📍 Current Status:")
-        print(f"   {current.get('status_text', 'Unknown')}")
-        print(f"   Chamber: {current.get('chamber', 'Unknown')}")
+        print(f"\n📍 Current Status:", file=out)
+        print(f"   {current['status_text']}", file=out)
+        print(f"   Chamber: {current['chamber']}", file=out)
 
     # Link
     if history:
-        print(f"\n🔗 More Info:")
-        print(f"   {history[0].get('text_url', 'N/A')}")
+        print(f"\n🔗 More Info:", file=out)
+        print(f"   {history[0]['text_url']}", file=out)
 
-    print("─" * 80)
+    print(_LIGHT_BAR, file=out)
+
+    return out.getvalue()
+
+
+def write_output(text: str) -> None:
+    """Write text to stdout as UTF-8 bytes in one call.
+
+    Encodes the emoji/box-drawing heavy output once instead of through the
+    text layer's incremental encoder, falling back to text writes for streams
+    without a binary buffer.
+    """
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:
+        sys.stdout.write(text)
+        return
+    sys.stdout.flush()  # Keep ordering with anything already printed
+    buffer.write(text.encode("utf-8"))
+    buffer.flush()
+
+
+def display_bill(bill: dict):
+    """Display detailed information about a bill in a single write."""
+    write_output(render_bill(bill))
+
+
+def print_usage():
+    """Print command-line usage."""
+    print("Usage: python bill_lookup.py [--json] [--daemon] <bill_id> [bill_id2] ...")
+    print("       python bill_lookup.py --build-shards")
+    print("\nExamples:")
+    print("  python bill_lookup.py C-11")
+    print("  python bill_lookup.py S-2 C-11 C-234")
+    print("  python bill_lookup.py --json S-2 C-11  # machine-readable output")
+    print("  python bill_lookup.py --daemon C-11    # keep bills resident")
+    print("  python bill_lookup.py --build-shards   # per-bill files for fast lookups")
+    print("\nTo see all bills, use: python bill_analytics.py")
 
 
 def main():
     """Main entry point."""
-    if len(sys.argv) < 2:
-        print("Usage: python bill_lookup.py <bill_id> [bill_id2] ...")
-        print("\nExamples:")
-        print("  python bill_lookup.py C-11")
-        print("  python bill_lookup.py S-2 C-11 C-234")
-        print("\nTo see all bills, use: python bill_analytics.py")
+    args = sys.argv[1:]
+    json_output = "--json" in args
+    use_daemon = "--daemon" in args
+    build_shards = "--build-shards" in args
+    args = [arg for arg in args if arg not in ("--json", "--daemon", "--build-shards")]
+
+    if build_shards:
+        # Explicit build step: lookups only read shards, never write them
+        bills = load_bills()
+        if bills:
+            build_bill_shards(bills)
+            print(f"Built bill shards from {len(bills)} bills")
+        if not args:
+            return
+
+    if not args or "-h" in args or "--help" in args:
+        print_usage()
         return
 
-    bills = load_bills()
-    if not bills:
+    # Reject malformed IDs before paying for any database load
+    for arg in args:
+        if not _BILL_ID_RE.match(arg):
+            print(
+                f"❌ Invalid bill id format: {arg} (expected e.g. C-11 or S-2)",
+                file=sys.stderr,
+            )
+
+    bill_ids = [arg.upper() for arg in args if _BILL_ID_RE.match(arg)]
+    if not bill_ids:
         return
 
-    # Create a lookup dictionary by bill_id
-    bills_dict = {bill["bill_id"]: bill for bill in bills}
+    # With --daemon, use (or start) a resident lookup daemon, which skips the
+    # full database parse
+    response = None
+    if use_daemon:
+        response = query_daemon(bill_ids)
+        if response is None and start_daemon():
+            response = query_daemon(bill_ids)
 
-    bill_ids = sys.argv[1:]
+    if response is not None:
+        bills_dict = response["bills"]
+        available = response["available"]
+        found = bills_dict.keys()
+    elif bill_shards_current():
+        # Built by --build-shards from the current database
+        # Only open the requested bills' shard files, overlapping the reads
+        unique_ids = list(dict.fromkeys(bill_ids))
+        with ThreadPoolExecutor(max_workers=min(8, len(unique_ids))) as executor:
+            shards = executor.map(load_bill_shard, unique_ids)
+            bills_dict = {
+                bill_id: bill
+                for bill_id, bill in zip(unique_ids, shards)
+                if bill is not None
+            }
+        found = bills_dict.keys()
+        missing = len(found) < len(unique_ids)
+        available = heapq.nsmallest(10, list_bill_shards()) if missing else []
+    else:
+        bills = load_bills()
+        if not bills:
+            return
 
-    for bill_id in bill_ids:
-        bill_id = bill_id.upper()  # Normalize to uppercase
+        # Create a lookup dictionary by bill_id
+        bills_dict = {bill["bill_id"]: bill for bill in bills}
+        requested = set(bill_ids)
+        found = requested & bills_dict.keys()
+        # Preview of available bills, only built if something is missing
+        available = heapq.nsmallest(10, bills_dict) if requested - found else []
+
+    # Scripted use: dump the raw records in one pass, skipping all formatting
+    if json_output:
+        records = [bills_dict[bill_id] for bill_id in bill_ids if bill_id in found]
+        write_output(json.dumps(records, ensure_ascii=False) + "\n")
+        return
 
-        if bill_id in bills_dict:
-            display_bill(bills_dict[bill_id])
+    # Preserve argv order while using the precomputed hit set, and emit every
+    # bill in one write so output can't interleave
+    rendered = []
+    for bill_id in bill_ids:
+        if bill_id in found:
+            rendered.append(render_bill(bills_dict[bill_id]))
         else:
-            print(f"\n❌ Bill {bill_id} not found in database.")
-            print(f"   Available bills: {', '.join(sorted(bills_dict.keys())[:10])}...")
+            rendered.append(
+                f"\n❌ Bill {bill_id} not found in database.\n"
+                f"   Available bills: {', '.join(available)}...\n"
+            )
+    write_output("".join(rendered))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+Bill Lookup Daemon - Keep the bill database resident for fast repeated lookups.
+
+Loads the database once and answers queries over a Unix domain socket so that
+repeated `bill_lookup.py` invocations skip the full database load.
+
+Protocol: the client sends newline-delimited bill IDs and closes its write
+side; the daemon replies with a single JSON object:
+    {"bills": {"C-11": {...}, ...}, "available": ["C-1", "C-2", ...]}
+
+The socket lives in a per-user directory ($XDG_RUNTIME_DIR, or a private
+directory under the system temp dir) and is named after the absolute database
+path, so each checkout gets its own daemon.
+
+Usage: python bill_lookup_daemon.py
+       (normally spawned by `python bill_lookup.py --daemon <bill_id>`)
+"""
+
+import hashlib
+import heapq
+import json
+import os
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from utils import BILLS_DB_PATH, database_mtime, load_bills
+
+IDLE_TIMEOUT_SECONDS = 15 * 60  # Exit after 15 minutes without a query
+CLIENT_TIMEOUT_SECONDS = 5
+
+
+def _runtime_dir() -> Optional[Path]:
+    """Per-user directory for the daemon socket, or None if none is safe."""
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return Path(runtime_dir)
+
+    # Fall back to a private directory in the shared temp dir, refusing one
+    # that another user created first
+    path = Path(tempfile.gettempdir()) / f"bill_lookup-{os.getuid()}"
+    try:
+        path.mkdir(mode=0o700, exist_ok=True)
+        st = path.lstat()
+    except OSError:
+        return None
+    if st.st_uid != os.getuid() or st.st_mode & 0o077:
+        return None
+    return path
+
+
+def socket_path() -> Optional[Path]:
+    """Socket path for the daemon serving this working directory's database."""
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+    runtime_dir = _runtime_dir()
+    if runtime_dir is None:
+        return None
+    db_key = hashlib.sha256(
+        str(Path(BILLS_DB_PATH).resolve()).encode("utf-8")
+    ).hexdigest()[:16]
+    return runtime_dir / f"bill_lookup-{db_key}.sock"
+
+
+def _remove_socket(path: Path) -> None:
+    """Remove a socket file, ignoring one that is gone or not ours."""
+    try:
+        path.unlink()
+    except OSError:
+        pass
+
+
+def _daemon_listening(path: Path) -> bool:
+    """Check whether a daemon accepts connections on path.
+
+    A socket file that refuses connections is left over from a crashed daemon
+    and is removed. Any other failure (e.g. a timeout while a live daemon is
+    busy reloading) counts as listening, so its socket is never deleted.
+    """
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+            probe.settimeout(CLIENT_TIMEOUT_SECONDS)
+            probe.connect(str(path))
+    except FileNotFoundError:
+        return False
+    except ConnectionRefusedError:
+        _remove_socket(path)
+        return False
+    except OSError:
+        return True
+    return True
+
+
+def _build_index(bills: List[dict]) -> Tuple[Dict[str, dict], List[str]]:
+    """Index bills by bill_id, with the preview of available IDs sent to clients."""
+    bills_dict = {bill["bill_id"]: bill for bill in bills}
+    return bills_dict, heapq.nsmallest(10, bills_dict)
+
+
+def _handle_client(
+    conn: socket.socket, bills_dict: Dict[str, dict], available: List[str]
+) -> None:
+    """Read requested bill IDs from a client and reply with the matching bills."""
+    conn.settimeout(CLIENT_TIMEOUT_SECONDS)
+    chunks = []
+    while True:
+        chunk = conn.recv(4096)
+        if not chunk:
+            break
+        chunks.append(chunk)
+
+    requested = b"".join(chunks).decode("utf-8").split()
+    response = {
+        "bills": {
+            bill_id: bills_dict[bill_id]
+            for bill_id in (b.upper() for b in requested)
+            if bill_id in bills_dict
+        },
+        "available": available,
+    }
+    conn.sendall(json.dumps(response, ensure_ascii=False).encode("utf-8"))
+
+
+def serve() -> None:
+    """Load bills once and serve lookups until idle for IDLE_TIMEOUT_SECONDS."""
+    sock_path = socket_path()
+    if sock_path is None:
+        sys.exit("No private runtime directory for the lookup socket")
+
+    # Another daemon already serves this database (removes a stale socket)
+    if _daemon_listening(sock_path):
+        return
+
+    loaded_mtime = database_mtime()
+    bills_dict, available = _build_index(load_bills())
+
+    # Make `kill` run the cleanup below instead of leaving a stale socket
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(str(sock_path))
+    server.listen()
+    server.settimeout(IDLE_TIMEOUT_SECONDS)
+
+    try:
+        while True:
+            try:
+                conn, _ = server.accept()
+            except socket.timeout:
+                break  # Idle too long
+
+            with conn:
+                # Pick up a freshly written database from the tracker
+                current_mtime = database_mtime()
+                if current_mtime != loaded_mtime:
+                    loaded_mtime = current_mtime
+                    bills_dict, available = _build_index(load_bills())
+
+                try:
+                    _handle_client(conn, bills_dict, available)
+                except (OSError, UnicodeDecodeError):
+                    continue
+    finally:
+        server.close()
+        _remove_socket(sock_path)
+
+
+def query_daemon(bill_ids: List[str]) -> Optional[dict]:
+    """Ask a running daemon for bills. Returns None if no daemon is listening."""
+    sock_path = socket_path()
+    if sock_path is None or not sock_path.exists():
+        return None
+
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(CLIENT_TIMEOUT_SECONDS)
+            sock.connect(str(sock_path))
+            sock.sendall(("\n".join(bill_ids) + "\n").encode("utf-8"))
+            sock.shutdown(socket.SHUT_WR)
+
+            chunks = []
+            while True:
+                chunk = sock.recv(65536)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+    except OSError:
+        return None
+
+    try:
+        return json.loads(b"".join(chunks))
+    except ValueError:
+        return None
+
+
+def start_daemon(wait_seconds: float = 5.0) -> bool:
+    """Spawn the daemon in the background and wait for its socket to appear.
+
+    Returns True straight away if a daemon is already listening.
+    """
+    sock_path = socket_path()
+    if sock_path is None:
+        return False
+
+    # A daemon that didn't answer the query may just be busy; only a socket
+    # nobody is listening on is replaced
+    if _daemon_listening(sock_path):
+        return True
+
+    subprocess.Popen(
+        [sys.executable, str(Path(__file__).resolve())],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+
+    deadline = time.monotonic() + wait_seconds
+    while time.monotonic() < deadline:
+        if sock_path.exists():
+            return True
+        time.sleep(0.05)
+    return False
+
+
+if __name__ == "__main__":
+    serve()
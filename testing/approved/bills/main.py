@@ -4,21 +4,43 @@ A persistent daemon that monitors bill status changes via the LEGISinfo API.
 """
 
 import argparse
+import concurrent.futures
+import functools
+import io
 import json
 import logging
+import multiprocessing
+import os
+import random
 import re
+import sqlite3
+import sys
+import threading
 import time
-import xml.etree.ElementTree as ET
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple
+from typing import IO, Iterator, List, Dict, Optional, Tuple
 
+import lxml.etree as LET
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson  # Optional: C-speed JSON parsing when migrating old databases
+except ImportError:
+    orjson = None
 
 # Configuration
 POLL_INTERVAL_HOURS = 4
+# Adaptive polling: back to MIN_POLL_HOURS after a poll with changes; after
+# IDLE_POLLS_BEFORE_BACKOFF polls in a row without any, the interval doubles
+# up to MAX_POLL_HOURS (e.g. during a recess)
+MIN_POLL_HOURS = 1
+MAX_POLL_HOURS = 24
+IDLE_POLLS_BEFORE_BACKOFF = 3
 LEGIS_URL = "https://www.parl.ca/legisinfo/en/bills/xml"
 # Current parliament to actively monitor (auto-detected from API)
 # Will be set to the highest parliament number found in the bills
@@ -26,8 +48,34 @@ CURRENT_PARLIAMENT = None  # Auto-detected on first fetch
 # Historical sessions to track (going back to 35th Parliament, 1994)
 # Format: Parliament-Session (e.g., "44-1" = 44th Parliament, 1st Session)
 HISTORICAL_PARLIAMENTS = list(range(35, 45))  # Parliaments 35 through 44
+MAX_SESSIONS_PER_PARLIAMENT = 4  # Probe up to 4 sessions of unlisted parliaments
+# Sessions per dissolved parliament (from the Library of Parliament's records).
+# Only these sessions are fetched; the current parliament and any parliament not
+# listed here are probed with HEAD requests instead.
+_KNOWN_SESSIONS = {35: 2, 36: 2, 37: 3, 38: 1, 39: 2, 40: 3, 41: 2, 42: 1, 43: 2, 44: 1}
+HISTORICAL_FETCH_WORKERS = 8  # Max concurrent historical session requests
+HISTORICAL_REQUEST_DELAY_SECONDS = 0.1  # Per-worker pause between requests
+HISTORICAL_PARSE_WORKERS = os.cpu_count() or 1  # Processes parsing session XML
+SAVE_BATCH_SIZE = 1000  # Max bills written per database transaction
+HTTP_POOL_MAXSIZE = 8  # Keep-alive connections to parl.ca (>= fetch workers)
+HTTP_TIMEOUT = (5, 30)  # (connect, read) seconds for LEGISinfo downloads
+HTTP_RETRY_STATUSES = (429, 500, 502, 503, 504)  # Transient server responses
+METRICS_INTERVAL_SECONDS = 60  # How often the daemon logs poll health
+SLOW_POLL_SECONDS = 120  # Polls slower than this are logged as warnings
+ERROR_RETRY_SECONDS = 300  # Base wait after an unexpected daemon loop error
+ERROR_RETRY_MAX_SECONDS = 3600  # Cap on the exponential error backoff
+POLL_JITTER_FRACTION = 0.05  # Poll interval is randomized by +/- 5%
 STORAGE_DIR = Path("assets")
-DB_FILE = STORAGE_DIR / "data.json"
+DB_FILE = STORAGE_DIR / "bills.sqlite"
+# Pre-SQLite JSON database in STORAGE_DIR, migrated on first load
+LEGACY_DB_NAME = "data.json"
+
+# Bill identifier prefix and number, e.g. "C-11" -> ("C", "11")
+_BILL_ID_RE = re.compile(r"([CS])-?(\d+)", re.IGNORECASE)
+
+# <Bill> elements, with or without a namespace
+BILL_TAG = "{*}Bill"
+_COUNT_PUBLICATIONS = LET.XPath("count(.//Publication)")
 
 # Logging setup
 logging.basicConfig(
@@ -51,6 +99,10 @@ class BillStage(Enum):
     UNKNOWN = "Unknown"
 
 
+# BillStage members by name; a plain lookup instead of BillStage[...] + KeyError
+_STAGE_BY_NAME = BillStage.__members__
+
+
 class CIFStatus(Enum):
     """Coming into Force status for bills that received Royal Assent."""
 
@@ -60,26 +112,151 @@ class CIFStatus(Enum):
     NOT_DETERMINED = "Not Yet Determined"  # Royal Assent received but CIF not analyzed
 
 
-@dataclass(frozen=True)
+# Default stage/CIF names, resolved once instead of through Enum.name per Bill
+_FIRST_READING_NAME = BillStage.FIRST_READING.name
+_CIF_NOT_DETERMINED_NAME = CIFStatus.NOT_DETERMINED.name
+
+# Log emoji per CIF status name, for process_passed_bill
+_CIF_STATUS_EMOJI = {
+    CIFStatus.ACTIVE_ON_ASSENT.name: "✅",
+    CIFStatus.FIXED_DATE.name: "📅",
+    CIFStatus.WAITING_FOR_ORDER.name: "⏳",
+}
+
+
+# Stage keywords in a LEGISinfo status, scanned in one pass. Input is already
+# lowercased. "passed" and "house" are separate tokens since they may appear in
+# either order.
+_STAGE_KEYWORDS_RE = re.compile(
+    r"(?P<ROYAL_ASSENT>royal assent)"
+    r"|(?P<DEFEATED>defeated|withdrawn|not proceeded)"
+    r"|(?P<THIRD_READING>third reading)"
+    r"|(?P<REPORT_STAGE>report)"
+    r"|(?P<COMMITTEE>committee)"
+    r"|(?P<SECOND_READING>second reading)"
+    r"|(?P<FIRST_READING>first reading|introduced)"
+    r"|(?P<passed>passed)"
+    r"|(?P<house>house)"
+)
+
+# Which stage wins when a status mentions several (e.g. "report stage and
+# third reading" is THIRD_READING)
+_STAGE_PRIORITY = (
+    "ROYAL_ASSENT",
+    "DEFEATED",
+    "THIRD_READING",
+    "REPORT_STAGE",
+    "COMMITTEE",
+    "SECOND_READING",
+    "FIRST_READING",
+)
+
+
+@functools.lru_cache(maxsize=512)
+def _status_to_stage(status_lower: str, royal_assent: bool) -> Optional[str]:
+    """
+    Map a lowercased LEGISinfo status to a BillStage name.
+
+    Status texts come from a small vocabulary repeated across every bill, so
+    the result is cached. Per-bill checks (chamber switches, publication
+    counts) stay in Bill.determine_stage_transition.
+
+    Returns:
+        BillStage name, or None if the status doesn't identify a stage
+    """
+    # Royal Assent (final stage)
+    if royal_assent:
+        return "ROYAL_ASSENT"
+
+    keywords = {match.lastgroup for match in _STAGE_KEYWORDS_RE.finditer(status_lower)}
+    for stage_name in _STAGE_PRIORITY:
+        if stage_name in keywords:
+            return stage_name
+
+    # Passed originating chamber
+    if "passed" in keywords and "house" in keywords:
+        return "PASSED_HOUSE"
+
+    return None
+
+
+# Chamber names, interned so BillState.chamber comparisons are mostly
+# pointer-equal
+CHAMBER_HOUSE = sys.intern("House of Commons")
+CHAMBER_SENATE = sys.intern("Senate")
+
+# BillState fields drawn from a small vocabulary shared across all bills
+_INTERNED_STATE_FIELDS = ("status_code", "status_text", "chamber", "stage")
+
+
+@dataclass(frozen=True, slots=True)
 class BillState:
     """Immutable snapshot of a bill's status at a specific point in time."""
 
     status_code: str
     status_text: str
-    timestamp: str  # ISO format datetime
+    timestamp: int  # Unix epoch seconds
     chamber: str
     text_url: str
     stage: Optional[str] = None  # BillStage enum value name
     text_changed: bool = False  # Whether bill text was amended
 
+    def __post_init__(self) -> None:
+        # Share one string object per distinct value across every bill's
+        # history (including states rebuilt by Bill.from_dict)
+        for field_name in _INTERNED_STATE_FIELDS:
+            value = getattr(self, field_name)
+            if isinstance(value, str):
+                object.__setattr__(self, field_name, sys.intern(value))
+        # Databases written before epoch timestamps stored ISO strings
+        if isinstance(self.timestamp, str):
+            epoch = int(datetime.fromisoformat(self.timestamp).timestamp())
+            object.__setattr__(self, "timestamp", epoch)
+
     def to_dict(self) -> Dict:
-        """Convert to dictionary for JSON serialization."""
-        return asdict(self)
+        """Convert to dictionary for JSON serialization.
+
+        The timestamp is rendered as ISO 8601 local time, as the lookup tools
+        expect.
+        """
+        # Flat literal rather than dataclasses.asdict, which recurses and
+        # deep-copies every field
+        return {
+            "status_code": self.status_code,
+            "status_text": self.status_text,
+            "timestamp": datetime.fromtimestamp(self.timestamp).isoformat(),
+            "chamber": self.chamber,
+            "text_url": self.text_url,
+            "stage": self.stage,
+            "text_changed": self.text_changed,
+        }
 
 
 class Bill:
     """Represents a single piece of legislation with its complete history."""
 
+    __slots__ = (
+        "session",
+        "bill_id",
+        "title",
+        "history",
+        "bill_type",
+        "sponsor",
+        "sponsor_affiliation",
+        "royal_assent_date",
+        "last_activity_date",
+        "has_royal_recommendation",
+        "current_stage",
+        "publication_count",
+        "is_active",
+        "died_on_order_paper",
+        "chapter_citation",
+        "cif_status",
+        "cif_details",
+        "dirty",
+        "saved_states",
+    )
+
     def __init__(
         self,
         session: str,
@@ -112,7 +289,7 @@ class Bill:
         self.last_activity_date = last_activity_date
         self.has_royal_recommendation = has_royal_recommendation
         # Stage tracking
-        self.current_stage = current_stage or BillStage.FIRST_READING.name
+        self.current_stage = current_stage or _FIRST_READING_NAME
         self.publication_count = publication_count
         # Lifecycle tracking
         self.is_active = is_active  # False if from old parliament and didn't pass
@@ -122,9 +299,13 @@ class Bill:
         # Royal Assent / Statute tracking
         self.chapter_citation = chapter_citation  # e.g., "S.C. 2023, c. 15"
         self.cif_status = (
-            cif_status or CIFStatus.NOT_DETERMINED.name
+            cif_status or _CIF_NOT_DETERMINED_NAME
         )  # Coming into Force status
         self.cif_details = cif_details  # Raw text from CIF section
+        # True while this bill has changes not yet written to the database
+        self.dirty = True
+        # Number of history entries already stored in the database
+        self.saved_states = 0
 
     @staticmethod
     def classify_bill_type(bill_id: str, title: str) -> str:
@@ -139,7 +320,7 @@ class Bill:
         - "New Act" - Title contains "Act respecting"
         """
         # Extract bill number from identifier (e.g., "C-11" -> 11, "S-5" -> 5)
-        match = re.match(r"([CS])-?(\d+)", bill_id, re.IGNORECASE)
+        match = _BILL_ID_RE.match(bill_id)
 
         if not match:
             return "Unknown"
@@ -212,74 +393,63 @@ class Bill:
             Tuple of (BillStage, text_changed_flag)
         """
         text_changed = False
-        status_lower = status_text.lower()
 
         # Check if bill is new (empty history)
         if not self.history:
             return (BillStage.FIRST_READING, False)
 
-        # Get previous chamber
-        previous_chamber = self.current_state.chamber if self.current_state else None
+        # Get previous chamber (history is non-empty here)
+        previous_chamber = self.history[-1].chamber
 
-        # Chamber switch detection (House -> Senate or Senate -> House)
+        # Chamber switch detection (House -> Senate or Senate -> House). Both
+        # sides are normally the interned CHAMBER_* strings, so the common
+        # unchanged case is an identity check.
         if previous_chamber and previous_chamber != chamber:
-            if chamber == "Senate" or "senate" in chamber.lower():
-                logger.info(f"📨 Bill {self.bill_id} moved to Senate")
+            if chamber == CHAMBER_SENATE or "senate" in chamber.lower():
+                logger.info("📨 Bill %s moved to Senate", self.bill_id)
                 return (BillStage.SENATE_STAGES, False)
-            elif chamber == "House of Commons" or "house" in chamber.lower():
-                logger.info(f"📨 Bill {self.bill_id} moved to House")
+            elif chamber == CHAMBER_HOUSE or "house" in chamber.lower():
+                logger.info("📨 Bill %s moved to House", self.bill_id)
                 return (BillStage.PASSED_HOUSE, False)
 
-        # Royal Assent (final stage)
-        if "royal assent" in status_lower or self.royal_assent_date:
-            return (BillStage.ROYAL_ASSENT, False)
-
-        # Defeated/withdrawn
-        if (
-            "defeated" in status_lower
-            or "withdrawn" in status_lower
-            or "not proceeded" in status_lower
-        ):
-            return (BillStage.DEFEATED, False)
-
-        # Third Reading
-        if "third reading" in status_lower:
-            return (BillStage.THIRD_READING, False)
+        stage_name = _status_to_stage(
+            status_text.lower(), bool(self.royal_assent_date)
+        )
 
         # Report Stage (critical for amendment detection)
-        if "report stage" in status_lower or "report" in status_lower:
+        if stage_name == "REPORT_STAGE":
             # Check if publication count increased (indicates amendment)
             if new_publication_count > self.publication_count:
                 text_changed = True
                 logger.info(
-                    f"📝 Amendment detected for {self.bill_id}: "
-                    f"Publications {self.publication_count} → {new_publication_count}"
+                    "📝 Amendment detected for %s: Publications %d → %d",
+                    self.bill_id,
+                    self.publication_count,
+                    new_publication_count,
                 )
             return (BillStage.REPORT_STAGE, text_changed)
 
-        # Committee Stage
-        if "committee" in status_lower:
-            return (BillStage.COMMITTEE, False)
-
-        # Second Reading
-        if "second reading" in status_lower:
-            return (BillStage.SECOND_READING, False)
-
-        # First Reading (default for new bills or initial stages)
-        if "first reading" in status_lower or "introduced" in status_lower:
-            return (BillStage.FIRST_READING, False)
-
-        # Passed originating chamber
-        if "passed" in status_lower and "house" in status_lower:
-            return (BillStage.PASSED_HOUSE, False)
+        if stage_name is not None:
+            return (_STAGE_BY_NAME[stage_name], False)
 
         # If we can't determine, keep current stage
-        try:
-            current_stage_enum = BillStage[self.current_stage]
-        except (KeyError, TypeError):
-            current_stage_enum = BillStage.UNKNOWN
+        return (_STAGE_BY_NAME.get(self.current_stage, BillStage.UNKNOWN), False)
+
+    def stage_is_settled(self, status_text: str) -> bool:
+        """
+        Whether the latest state's stage is the one status_text maps to.
 
-        return (current_stage_enum, False)
+        A bill's first state and a chamber-switch state record a stage from
+        the history/chamber alone (FIRST_READING, SENATE_STAGES, PASSED_HOUSE),
+        so an identical status on the next poll can still move the stage.
+        """
+        if not self.history:
+            return False
+        stage = self.history[-1].stage
+        return stage == (
+            _status_to_stage(status_text.lower(), bool(self.royal_assent_date))
+            or stage
+        )
 
     def update(
         self,
@@ -288,13 +458,34 @@ class Bill:
         chamber: str,
         text_url: str,
         publication_count: int = 0,
+        timestamp: Optional[int] = None,
     ) -> bool:
         """
         Compare new data against current state. If different, append new BillState.
 
+        Args:
+            timestamp: Epoch seconds to record on a new state; callers
+                processing a whole poll pass one value for every bill.
+                Defaults to now.
+
         Returns:
             True if a change was detected and recorded, False otherwise.
         """
+        # Latest state, read once for every comparison below
+        current = self.history[-1] if self.history else None
+
+        # Fast path for the common unchanged poll: same status, chamber and
+        # publication count, and a settled stage (see stage_is_settled)
+        if (
+            current is not None
+            and current.status_code == status_code
+            and current.status_text == status_text
+            and current.chamber == chamber
+            and publication_count == self.publication_count
+            and self.stage_is_settled(status_text)
+        ):
+            return False
+
         # Determine stage transition
         new_stage, text_changed = self.determine_stage_transition(
             status_text, chamber, publication_count
@@ -303,7 +494,7 @@ class Bill:
         new_state = BillState(
             status_code=status_code,
             status_text=status_text,
-            timestamp=datetime.now().isoformat(),
+            timestamp=int(time.time()) if timestamp is None else timestamp,
             chamber=chamber,
             text_url=text_url,
             stage=new_stage.name,
@@ -311,46 +502,56 @@ class Bill:
         )
 
         # Check if state has changed
-        if self.current_state is None:
+        if current is None:
             # First time seeing this bill
             self.current_stage = new_stage.name
             self.publication_count = publication_count
             self.history.append(new_state)
+            self.dirty = True
             return True
 
         # Compare all fields except timestamp
         state_changed = (
-            self.current_state.status_code != new_state.status_code
-            or self.current_state.status_text != new_state.status_text
-            or self.current_state.chamber != new_state.chamber
-            or self.current_state.stage != new_state.stage
+            current.status_code != new_state.status_code
+            or current.status_text != new_state.status_text
+            or current.chamber != new_state.chamber
+            or current.stage != new_state.stage
             or text_changed
         )
 
         if state_changed:
-            old_status = self.current_state.status_text
-            old_stage = self.current_state.stage or "Unknown"
+            old_status = current.status_text
+            old_stage = current.stage or "Unknown"
 
             # Update tracking fields
             self.current_stage = new_stage.name
             self.publication_count = publication_count
 
             self.history.append(new_state)
+            self.dirty = True
 
-            # Enhanced logging
+            # Enhanced logging. Lazy %-style arguments: a backfill records
+            # many transitions, so skip formatting when INFO is disabled
             if text_changed:
                 logger.info(
-                    f"📝 AMENDMENT: Bill {self.bill_id} text changed at {new_stage.value}"
+                    "📝 AMENDMENT: Bill %s text changed at %s",
+                    self.bill_id,
+                    new_stage.value,
                 )
 
-            stage_change = (
-                f" [{old_stage} → {new_stage.name}]"
-                if old_stage != new_stage.name
-                else ""
-            )
-            logger.info(
-                f"⚠️  ALERT: Bill {self.bill_id} moved from '{old_status}' → '{status_text}'{stage_change}"
-            )
+            if logger.isEnabledFor(logging.INFO):
+                stage_change = (
+                    f" [{old_stage} → {new_stage.name}]"
+                    if old_stage != new_stage.name
+                    else ""
+                )
+                logger.info(
+                    "⚠️  ALERT: Bill %s moved from '%s' → '%s'%s",
+                    self.bill_id,
+                    old_status,
+                    status_text,
+                    stage_change,
+                )
 
             # If bill just received Royal Assent, trigger statute processing
             if (
@@ -358,11 +559,11 @@ class Bill:
                 and old_stage != BillStage.ROYAL_ASSENT.name
             ):
                 logger.info(
-                    f"🎉 Bill {self.bill_id} received ROYAL ASSENT - now a Statute!"
+                    "🎉 Bill %s received ROYAL ASSENT - now a Statute!", self.bill_id
                 )
                 # Note: Full text processing would happen here if we had access to bill text
                 # For now, we mark it for later processing
-                self.cif_status = CIFStatus.NOT_DETERMINED.name
+                self.cif_status = _CIF_NOT_DETERMINED_NAME
 
             return True
 
@@ -393,7 +594,20 @@ class Bill:
     @classmethod
     def from_dict(cls, data: Dict) -> "Bill":
         """Deserialize bill from JSON data."""
-        history = [BillState(**state_data) for state_data in data.get("history", [])]
+        # Positional construction in field order; states saved before "stage"
+        # and "text_changed" existed lack those keys
+        history = [
+            BillState(
+                state["status_code"],
+                state["status_text"],
+                state["timestamp"],
+                state["chamber"],
+                state["text_url"],
+                state.get("stage"),
+                state.get("text_changed", False),
+            )
+            for state in data.get("history", [])
+        ]
         return cls(
             session=data["session"],
             bill_id=data["bill_id"],
@@ -421,6 +635,55 @@ class Bill:
 # Royal Assent Processing Functions
 # =============================================================================
 
+# Chapter citation formats, tried in order
+# Chapter citations in one pass: "S.C. YYYY, c. NN" (most common), "S.C.
+# YYYY, ch. NN" and "Statutes of Canada YYYY Chapter NN", with loose spacing
+_CHAPTER_CITATION_RE = re.compile(
+    r"(?:S\.C\.|Statutes\s+of\s+Canada)\s*(\d{4})[,\s]+(?:c(?:h)?\.?|Chapter)\s*(\d+)",
+    re.IGNORECASE,
+)
+
+# Coming into Force section headers, case-insensitive. Each branch starts with
+# a literal (case-sensitive) letter so re can skip through the 2000-char tail
+# on those first characters instead of trying a case-folded match at every
+# offset (~10x faster than a plain IGNORECASE alternation).
+_CIF_HEADER_RE = re.compile(
+    r"C(?i:oming into Force|ommencement)"
+    r"|c(?i:oming into Force|ommencement)"
+    r"|E(?i:ntry into Force)"
+    r"|e(?i:ntry into Force)"
+)
+
+# CIF wording classified in a single finditer pass over the details, one
+# named group per kind of cue:
+# - order: commencement deferred to an Order in Council
+# - day_fixed: "on a day to be fixed", a date cue that is itself to be fixed
+# - to_be_fixed: zero-width, so it does not swallow a following "fixed by order"
+# - date: a year or a month name (which also covers "DD Month")
+# Wording for commencement on Royal Assent needs no group: it classifies the
+# same as a CIF section with no cues at all.
+_CIF_CUE_RE = re.compile(
+    r"(?P<order>Order in Council|order of the Governor|fixed by order)"
+    r"|(?P<day_fixed>on a day to be fixed)"
+    r"|(?P<to_be_fixed>(?=to be fixed))"
+    r"|(?P<date>\d{4}"
+    r"|January|February|March|April|May|June|July|August|September|October"
+    r"|November|December)",
+    re.IGNORECASE,
+)
+
+
+def _iter_strings(value) -> Iterator[str]:
+    """Yield the string leaves of nested dicts/lists/tuples."""
+    if isinstance(value, str):
+        yield value
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from _iter_strings(item)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            yield from _iter_strings(item)
+
 
 def extract_chapter_citation(bill_text: str, metadata: Dict) -> Optional[str]:
     """
@@ -438,34 +701,21 @@ def extract_chapter_citation(bill_text: str, metadata: Dict) -> Optional[str]:
     Returns:
         Chapter citation string or None if not found
     """
-    # Pattern 1: S.C. YYYY, c. NN (most common)
-    pattern1 = r"S\.C\.\s*(\d{4}),\s*c(?:h)?\.?\s*(\d+)"
-
-    # Pattern 2: Statutes of Canada YYYY Chapter NN
-    pattern2 = r"Statutes\s+of\s+Canada\s+(\d{4})\s+Chapter\s+(\d+)"
-
-    # Pattern 3: Alternative formatting variations
-    pattern3 = (
-        r"(?:S\.C\.|Statutes of Canada)\s*(\d{4})[,\s]+(?:c\.|ch\.|Chapter)\s*(\d+)"
-    )
-
-    # Search in metadata first (more reliable)
-    metadata_text = str(metadata)
-    for pattern in [pattern1, pattern2, pattern3]:
-        match = re.search(pattern, metadata_text, re.IGNORECASE)
-        if match:
-            year = match.group(1)
-            chapter = match.group(2)
-            return f"S.C. {year}, c. {chapter}"
-
-    # Search in bill text (first 5000 chars where chapter info usually appears)
-    text_header = bill_text[:5000] if bill_text else ""
-    for pattern in [pattern1, pattern2, pattern3]:
-        match = re.search(pattern, text_header, re.IGNORECASE)
+    # Search metadata values first (more reliable), one string at a time
+    # rather than through a repr of the whole dict
+    for text in _iter_strings(metadata):
+        match = _CHAPTER_CITATION_RE.search(text)
         if match:
-            year = match.group(1)
-            chapter = match.group(2)
-            return f"S.C. {year}, c. {chapter}"
+            break
+    else:
+        # Then the bill text's first 5000 chars where chapter info usually
+        # appears; endpos bounds the scan without copying the header out
+        match = _CHAPTER_CITATION_RE.search(bill_text or "", 0, 5000)
+
+    if match:
+        year = match.group(1)
+        chapter = match.group(2)
+        return f"S.C. {year}, c. {chapter}"
 
     return None
 
@@ -486,78 +736,51 @@ def analyze_coming_into_force(bill_text: str) -> Tuple[str, Optional[str]]:
         Tuple of (CIFStatus enum name, details text)
     """
     if not bill_text:
-        return (CIFStatus.NOT_DETERMINED.name, None)
+        return (_CIF_NOT_DETERMINED_NAME, None)
 
     # Scan last 2000 characters where CIF sections typically appear
-    cif_section = bill_text[-2000:]
+    return _analyze_cif_section(bill_text[-2000:])
 
-    # Look for Coming into Force header
-    cif_patterns = [
-        r"Coming into Force",
-        r"Coming into force",
-        r"Commencement",
-        r"Entry into Force",
-    ]
 
-    cif_header_found = False
-    cif_text_start = -1
+@functools.lru_cache(maxsize=256)
+def _analyze_cif_section(cif_section: str) -> Tuple[str, Optional[str]]:
+    """Classify a bill's trailing CIF text; cached since only the tail matters.
 
-    for pattern in cif_patterns:
-        match = re.search(pattern, cif_section, re.IGNORECASE)
-        if match:
-            cif_header_found = True
-            cif_text_start = match.start()
-            break
+    Keys are at most 2000 characters, so the cache stays around 1 MB.
+    """
+    # Look for the first Coming into Force header
+    match = _CIF_HEADER_RE.search(cif_section)
 
     # If no CIF section found, default to active on assent
-    if not cif_header_found:
+    if match is None:
         return (
             CIFStatus.ACTIVE_ON_ASSENT.name,
             "No Coming into Force section found - defaults to Royal Assent",
         )
 
     # Extract text after CIF header (next 500 chars)
+    cif_text_start = match.start()
     cif_details = cif_section[cif_text_start : cif_text_start + 500]
 
-    # Check for Order in Council pattern
-    order_patterns = [
-        r"Order in Council",
-        r"order of the Governor in Council",
-        r"by order of the Governor",
-        r"fixed by order",
-    ]
-
-    for pattern in order_patterns:
-        if re.search(pattern, cif_details, re.IGNORECASE):
+    # An Order in Council cue wins outright; a date/year mention means a
+    # fixed date unless the text also says "to be fixed" (then it's likely
+    # Order in Council too)
+    has_date = to_be_fixed = False
+    for cue in _CIF_CUE_RE.finditer(cif_details):
+        kind = cue.lastgroup
+        if kind == "date":
+            has_date = True
+        elif kind == "to_be_fixed":
+            to_be_fixed = True
+        else:  # order, day_fixed
+            return (CIFStatus.WAITING_FOR_ORDER.name, cif_details.strip())
+        if has_date and to_be_fixed:
             return (CIFStatus.WAITING_FOR_ORDER.name, cif_details.strip())
 
-    # Check for specific date/year mentions
-    date_patterns = [
-        r"\d{4}",  # Year
-        r"(January|February|March|April|May|June|July|August|September|October|November|December)",
-        r"\d{1,2}\s+(January|February|March|April|May|June|July|August|September|October|November|December)",
-        r"on a day to be fixed",
-    ]
-
-    for pattern in date_patterns:
-        if re.search(pattern, cif_details, re.IGNORECASE):
-            # If mentions "to be fixed" it's likely Order in Council
-            if re.search(r"to be fixed", cif_details, re.IGNORECASE):
-                return (CIFStatus.WAITING_FOR_ORDER.name, cif_details.strip())
-            return (CIFStatus.FIXED_DATE.name, cif_details.strip())
-
-    # Check for "on assent" or "on sanction"
-    assent_patterns = [
-        r"on (?:the day on which|royal) assent",
-        r"on sanction",
-        r"(?:on|upon) (?:its )?(?:receiving|receipt of) (?:royal )?assent",
-    ]
-
-    for pattern in assent_patterns:
-        if re.search(pattern, cif_details, re.IGNORECASE):
-            return (CIFStatus.ACTIVE_ON_ASSENT.name, cif_details.strip())
-
-    # Default to active on assent if section exists but unclear
+    if has_date:
+        return (CIFStatus.FIXED_DATE.name, cif_details.strip())
+
+    # On assent / on sanction, or a section that exists but is unclear
     return (CIFStatus.ACTIVE_ON_ASSENT.name, cif_details.strip())
 
 
@@ -580,7 +803,7 @@ def process_passed_bill(bill: Bill, bill_text: str = "", metadata: Dict = None)
         True if processing was performed, False if already processed
     """
     # Only process if not already done
-    if bill.chapter_citation or bill.cif_status != CIFStatus.NOT_DETERMINED.name:
+    if bill.chapter_citation or bill.cif_status != _CIF_NOT_DETERMINED_NAME:
         return False
 
     metadata = metadata or {}
@@ -597,28 +820,218 @@ def process_passed_bill(bill: Bill, bill_text: str = "", metadata: Dict = None)
     cif_status, cif_details = analyze_coming_into_force(bill_text)
     bill.cif_status = cif_status
     bill.cif_details = cif_details
+    bill.dirty = True
 
     # Log CIF status
-    status_emoji = {
-        CIFStatus.ACTIVE_ON_ASSENT.name: "✅",
-        CIFStatus.FIXED_DATE.name: "📅",
-        CIFStatus.WAITING_FOR_ORDER.name: "⏳",
-    }
-    emoji = status_emoji.get(cif_status, "❓")
+    emoji = _CIF_STATUS_EMOJI.get(cif_status, "❓")
     logger.info(f"{emoji} Bill {bill.bill_id} CIF status: {cif_status}")
 
     return True
 
 
+def _iter_bill_elements(source: IO[bytes]) -> Iterator[LET._Element]:
+    """Stream <Bill> elements from an XML document in a single forward pass.
+
+    Each element is cleared (and detached from the root) once the caller moves
+    on, so the full tree is never held in memory.
+    """
+    for _, elem in LET.iterparse(source, events=("end",), tag=BILL_TAG):
+        yield elem
+        elem.clear()
+        while elem.getprevious() is not None:
+            del elem.getparent()[0]
+
+
+# Keys of the bill records built by BillTracker._parse_bill_element. Poll
+# snapshots are taken in this fixed order, independent of dict insertion order.
+_BILL_RECORD_FIELDS = (
+    "bill_id",
+    "session",
+    "title",
+    "status_code",
+    "status_text",
+    "chamber",
+    "text_url",
+    "sponsor",
+    "sponsor_affiliation",
+    "royal_assent_date",
+    "last_activity_date",
+    "has_royal_recommendation",
+    "publication_count",
+)
+
+# Bill columns in the bills table (besides the unique_key primary key); the
+# names match Bill attributes and Bill.__init__ parameters
+_BILL_COLUMNS = (
+    "session",
+    "bill_id",
+    "title",
+    "bill_type",
+    "sponsor",
+    "sponsor_affiliation",
+    "royal_assent_date",
+    "last_activity_date",
+    "has_royal_recommendation",
+    "current_stage",
+    "publication_count",
+    "is_active",
+    "died_on_order_paper",
+    "chapter_citation",
+    "cif_status",
+    "cif_details",
+)
+_BOOL_BILL_COLUMNS = ("has_royal_recommendation", "is_active", "died_on_order_paper")
+
+# BillState fields, in declaration order
+_STATE_COLUMNS = (
+    "status_code",
+    "status_text",
+    "timestamp",
+    "chamber",
+    "text_url",
+    "stage",
+    "text_changed",
+)
+
+_DB_SCHEMA = """
+CREATE TABLE IF NOT EXISTS bills (
+    unique_key TEXT PRIMARY KEY,
+    session TEXT NOT NULL,
+    bill_id TEXT NOT NULL,
+    title TEXT NOT NULL,
+    bill_type TEXT,
+    sponsor TEXT,
+    sponsor_affiliation TEXT,
+    royal_assent_date TEXT,
+    last_activity_date TEXT,
+    has_royal_recommendation INTEGER NOT NULL DEFAULT 0,
+    current_stage TEXT,
+    publication_count INTEGER NOT NULL DEFAULT 0,
+    is_active INTEGER NOT NULL DEFAULT 1,
+    died_on_order_paper INTEGER NOT NULL DEFAULT 0,
+    chapter_citation TEXT,
+    cif_status TEXT,
+    cif_details TEXT
+);
+CREATE TABLE IF NOT EXISTS bill_states (
+    unique_key TEXT NOT NULL REFERENCES bills(unique_key),
+    seq INTEGER NOT NULL,
+    status_code TEXT,
+    status_text TEXT,
+    timestamp INTEGER,
+    chamber TEXT,
+    text_url TEXT,
+    stage TEXT,
+    text_changed INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (unique_key, seq)
+);
+CREATE TABLE IF NOT EXISTS metadata (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS session_cache (
+    session_id TEXT PRIMARY KEY,
+    etag TEXT,
+    last_modified TEXT,
+    body_len INTEGER,
+    fetched_at TEXT
+);
+"""
+
+_UPSERT_BILL_SQL = (
+    f"INSERT INTO bills (unique_key, {', '.join(_BILL_COLUMNS)}) "
+    f"VALUES ({', '.join('?' * (len(_BILL_COLUMNS) + 1))}) "
+    "ON CONFLICT(unique_key) DO UPDATE SET "
+    + ", ".join(f"{column} = excluded.{column}" for column in _BILL_COLUMNS)
+)
+_INSERT_STATE_SQL = (
+    f"INSERT INTO bill_states (unique_key, seq, {', '.join(_STATE_COLUMNS)}) "
+    f"VALUES ({', '.join('?' * (len(_STATE_COLUMNS) + 2))})"
+)
+
+
+@dataclass
+class _SessionFetch:
+    """Result of downloading one historical session's bills XML."""
+
+    body: Optional[bytes]  # None if unchanged since the cached fetch
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+
+def _connect_db() -> sqlite3.Connection:
+    """Open the bill database, creating the schema if needed.
+
+    The connection is shared by the tracker's threads; callers serialize
+    access with BillTracker._db_lock.
+    """
+    conn = sqlite3.connect(DB_FILE, check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA busy_timeout=5000")  # Wait out other writers (ms)
+    conn.execute("PRAGMA mmap_size=268435456")  # Memory-map up to 256 MB
+    conn.executescript(_DB_SCHEMA)
+    return conn
+
+
+def _loads_json(payload: bytes) -> Dict:
+    """Parse JSON bytes, using orjson when it's installed."""
+    if orjson is not None:
+        return orjson.loads(payload)
+    return json.loads(payload)
+
+
 class BillTracker:
     """Tracks bills and their status changes over time."""
 
     def __init__(self, fetch_historical: bool = True):
         self.bills: Dict[str, Bill] = {}
         self.fetch_historical = fetch_historical
+        self._http = self._create_http_session()
+        # Validators from the last full fetch of LEGIS_URL, for conditional GETs
+        self._last_modified: Optional[str] = None
+        self._etag: Optional[str] = None
+        # Field values (in _BILL_RECORD_FIELDS order) of each current bill's
+        # record from the previous poll; identical records are skipped without
+        # touching their Bill objects
+        self._last_seen: Dict[str, Tuple] = {}
+        # Daemon state, shared with the metrics thread
+        self._stop_event = threading.Event()
+        self._poll_count = 0
+        self._poll_errors = 0
+        self._last_poll_seconds: Optional[float] = None
+        # (bill count, CURRENT_PARLIAMENT) as of the last full lifecycle scan
+        self._lifecycle_checked: Optional[Tuple[int, int]] = None
+        # Bill changes seen by the last poll (None if it didn't complete)
+        self._last_poll_changes: Optional[int] = None
+        # Serializes use of self._db; saves also rely on it so history states
+        # are appended only once
+        self._db_lock = threading.Lock()
+        # session_cache rows for freshly parsed sessions, written by the next
+        # _save_database in the same transaction as their bills
+        self._session_cache_updates: List[Tuple] = []
+        # (etag, last_modified) as last written to the metadata table
+        self._saved_validators: Optional[Tuple] = None
         self._ensure_storage_exists()
+        self._db = _connect_db()
         self._load_database()
 
+    @staticmethod
+    def _create_http_session() -> requests.Session:
+        """Create a pooled keep-alive session shared by all LEGISinfo requests."""
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=HTTP_POOL_MAXSIZE,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=HTTP_RETRY_STATUSES,
+            ),
+        )
+        session.mount("https://", adapter)
+        return session
+
     def _ensure_storage_exists(self) -> None:
         """Create the legislation folder if it doesn't exist."""
         STORAGE_DIR.mkdir(exist_ok=True)
@@ -630,20 +1043,17 @@ class BillTracker:
         Returns the highest parliament number found in the bills.
 
         Args:
-            bill_data_list: List of bill data dictionaries with 'session' field
+            bill_data_list: List of bill data dictionaries with a
+                'parliament_num' field
 
         Returns:
             Highest parliament number found
         """
-        parliament_numbers = []
-        for bill_data in bill_data_list:
-            session = bill_data.get("session", "")
-            if session and "-" in session:
-                try:
-                    parliament_num = int(session.split("-")[0])
-                    parliament_numbers.append(parliament_num)
-                except (ValueError, IndexError):
-                    continue
+        parliament_numbers = [
+            bill_data["parliament_num"]
+            for bill_data in bill_data_list
+            if bill_data.get("parliament_num") is not None
+        ]
 
         if parliament_numbers:
             current = max(parliament_numbers)
@@ -686,7 +1096,12 @@ class BillTracker:
             )
 
         # Step 2: Load existing database
-        if not DB_FILE.exists():
+        legacy_db_file = STORAGE_DIR / LEGACY_DB_NAME
+        with self._db_lock:
+            database_empty = (
+                self._db.execute("SELECT 1 FROM bills LIMIT 1").fetchone() is None
+            )
+        if database_empty and not legacy_db_file.exists():
             logger.info("No existing database found. Starting fresh.")
 
             # Process the current bills we just fetched
@@ -704,12 +1119,12 @@ class BillTracker:
             return
 
         try:
-            with open(DB_FILE, "r", encoding="utf-8") as f:
-                data = json.load(f)
-
-            for bill_data in data.get("bills", []):
-                bill = Bill.from_dict(bill_data)
-                self.bills[bill.unique_key] = bill
+            if database_empty:
+                self._read_legacy_database(legacy_db_file)
+                logger.info("Migrating JSON database to SQLite...")
+                self._save_database()
+            else:
+                self._read_database()
 
             bills_loaded = len(self.bills)
             logger.info(f"Loaded {bills_loaded} bills from database.")
@@ -733,28 +1148,42 @@ class BillTracker:
         except Exception as e:
             logger.error(f"Failed to load database: {e}")
 
-    def _fetch_current_bills_xml(self) -> List[Dict]:
+    def _fetch_current_bills_xml(
+        self, conditional: bool = False
+    ) -> Optional[List[Dict]]:
         """Fetch and parse current bills from the main API endpoint.
 
+        Args:
+            conditional: Send If-None-Match / If-Modified-Since from the last
+                fetch so an unchanged feed isn't downloaded or parsed again
+
         Returns:
-            List of parsed bill data dictionaries
+            List of parsed bill data dictionaries, or None if the server
+            reported the feed unchanged (HTTP 304)
         """
-        try:
-            response = requests.get(LEGIS_URL, timeout=30)
-            response.raise_for_status()
-
-            root = ET.fromstring(response.content)
-            ns = {"ns": root.tag.split("}")[0].strip("{")} if "}" in root.tag else {}
+        headers = {}
+        if conditional:
+            if self._etag:
+                headers["If-None-Match"] = self._etag
+            if self._last_modified:
+                headers["If-Modified-Since"] = self._last_modified
 
-            bill_data_list = []
-            for bill_elem in root.iter():
-                if "Bill" in bill_elem.tag:
-                    try:
-                        bill_data = self._parse_bill_element(bill_elem, ns)
-                        if bill_data:
-                            bill_data_list.append(bill_data)
-                    except Exception as e:
-                        logger.debug(f"Failed to parse bill element: {e}")
+        try:
+            # Parse straight off the socket as the body arrives
+            with self._http.get(
+                LEGIS_URL, headers=headers, timeout=HTTP_TIMEOUT, stream=True
+            ) as response:
+                if response.status_code == 304:
+                    return None
+                response.raise_for_status()
+
+                response.raw.decode_content = True  # Undo gzip/deflate encoding
+                bill_data_list = self._parse_bills_xml(response.raw, "current bills")
+
+                # Only remember validators once the whole body was read, so a
+                # truncated download isn't later confirmed by a 304
+                self._etag = response.headers.get("ETag")
+                self._last_modified = response.headers.get("Last-Modified")
 
             return bill_data_list
 
@@ -765,6 +1194,31 @@ class BillTracker:
             logger.error(f"Error parsing current bills XML: {e}")
             return []
 
+    @staticmethod
+    def _parse_bills_xml(source: IO[bytes], context: str) -> List[Dict]:
+        """Stream-parse a LEGISinfo bills document into bill data dictionaries.
+
+        Args:
+            source: Binary file-like object containing the XML
+            context: Label for debug logging (e.g. a session ID)
+
+        Returns:
+            List of parsed bill data dictionaries
+
+        Raises:
+            lxml.etree.XMLSyntaxError: If the document is malformed
+        """
+        bill_data_list = []
+        for bill_elem in _iter_bill_elements(source):
+            try:
+                bill_data = BillTracker._parse_bill_element(bill_elem)
+                if bill_data:
+                    bill_data_list.append(bill_data)
+            except Exception as e:
+                logger.debug(f"Failed to parse bill in {context}: {e}")
+
+        return bill_data_list
+
     def _process_bill_data_batch(self, bill_data_list: List[Dict]) -> int:
         """Process a batch of bill data and return number of changes detected.
 
@@ -775,103 +1229,370 @@ class BillTracker:
             Number of bills that had changes
         """
         changes = 0
+        now = int(time.time())
         for bill_data in bill_data_list:
             try:
                 # Only process bills from current parliament
-                session = bill_data["session"]
-                parliament_num = int(session.split("-")[0])
-
+                parliament_num = bill_data["parliament_num"]
                 if CURRENT_PARLIAMENT and parliament_num == CURRENT_PARLIAMENT:
-                    changed = self._process_bill(bill_data, suppress_new_log=False)
-                    if changed:
+                    unique_key = f"{bill_data['session']}-{bill_data['bill_id']}"
+                    if self._process_polled_bill(unique_key, bill_data, now):
                         changes += 1
             except Exception as e:
                 logger.warning(f"Failed to process bill: {e}")
 
         return changes
 
+    def _process_polled_bill(
+        self, unique_key: str, bill_data: Dict, timestamp: Optional[int] = None
+    ) -> bool:
+        """Process a current-parliament bill record from a poll.
+
+        A record identical to the one seen for this bill on the previous poll
+        is skipped without going through Bill.update, unless the bill's stage
+        hasn't settled on the one its status maps to yet.
+
+        Returns:
+            True if the bill changed
+        """
+        snapshot = tuple(bill_data.get(field) for field in _BILL_RECORD_FIELDS)
+        bill = self.bills.get(unique_key)
+        if (
+            bill is not None
+            and self._last_seen.get(unique_key) == snapshot
+            and bill.stage_is_settled(bill_data["status_text"])
+        ):
+            return False
+
+        changed = self._process_bill(bill_data, timestamp=timestamp)
+        self._last_seen[unique_key] = snapshot
+        return changed
+
+    def _read_database(self) -> None:
+        """Load all bills, their history and fetch metadata from DB_FILE."""
+        with self._db_lock:
+            conn = self._db
+            metadata = dict(conn.execute("SELECT key, value FROM metadata"))
+
+            # Validators captured by the startup fetch are newer
+            self._last_modified = self._last_modified or metadata.get("last_modified")
+            self._etag = self._etag or metadata.get("etag")
+
+            histories: Dict[str, List[BillState]] = {}
+            for unique_key, *state in conn.execute(
+                f"SELECT unique_key, {', '.join(_STATE_COLUMNS)} FROM bill_states "
+                "ORDER BY unique_key, seq"
+            ):
+                state[-1] = bool(state[-1])  # text_changed
+                histories.setdefault(unique_key, []).append(BillState(*state))
+
+            for unique_key, *values in conn.execute(
+                f"SELECT unique_key, {', '.join(_BILL_COLUMNS)} FROM bills"
+            ):
+                fields = dict(zip(_BILL_COLUMNS, values))
+                for column in _BOOL_BILL_COLUMNS:
+                    fields[column] = bool(fields[column])
+
+                bill = Bill(history=histories.get(unique_key, []), **fields)
+                bill.dirty = False
+                bill.saved_states = len(bill.history)
+                self.bills[unique_key] = bill
+
+    def _read_legacy_database(self, legacy_db_file: Path) -> None:
+        """Load bills from the pre-SQLite JSON database.
+
+        Loaded bills stay dirty so the next save writes them all to DB_FILE.
+        """
+        data = _loads_json(legacy_db_file.read_bytes())
+        self._last_modified = self._last_modified or data.get("last_modified")
+        self._etag = self._etag or data.get("etag")
+
+        for bill_data in data.get("bills", []):
+            bill = Bill.from_dict(bill_data)
+            self.bills[bill.unique_key] = bill
+
     def _save_database(self) -> None:
-        """Save all bills and their history to disk."""
+        """Save new and changed bills to the database.
+
+        Each dirty bill's row is upserted and only the history states not yet
+        stored are appended. A poll's changes fit in one transaction; large
+        saves (e.g. the historical backfill) commit every SAVE_BATCH_SIZE bills
+        to bound WAL growth. A save with nothing new to write is skipped.
+        """
+        try:
+            with self._db_lock:
+                dirty_bills = [bill for bill in list(self.bills.values()) if bill.dirty]
+                validators = (self._etag, self._last_modified)
+                if (
+                    not dirty_bills
+                    and not self._session_cache_updates
+                    and validators == self._saved_validators
+                ):
+                    logger.debug("No changes to save.")
+                    return
+                states_saved = 0
+
+                for batch_start in range(0, len(dirty_bills), SAVE_BATCH_SIZE):
+                    batch = dirty_bills[batch_start : batch_start + SAVE_BATCH_SIZE]
+                    bill_rows = []
+                    state_rows = []
+                    saved_counts = []
+                    for bill in batch:
+                        bill_rows.append(
+                            (bill.unique_key,)
+                            + tuple(getattr(bill, column) for column in _BILL_COLUMNS)
+                        )
+                        history = bill.history
+                        for seq in range(bill.saved_states, len(history)):
+                            state = history[seq]
+                            state_rows.append(
+                                (bill.unique_key, seq)
+                                + tuple(
+                                    getattr(state, column) for column in _STATE_COLUMNS
+                                )
+                            )
+                        saved_counts.append(len(history))
+
+                    with self._db as conn:
+                        # Take the write lock up front rather than on first insert
+                        conn.execute("BEGIN IMMEDIATE")
+                        conn.executemany(_UPSERT_BILL_SQL, bill_rows)
+                        conn.executemany(_INSERT_STATE_SQL, state_rows)
+
+                    for bill, saved_count in zip(batch, saved_counts):
+                        bill.dirty = False
+                        bill.saved_states = saved_count
+                    states_saved += len(state_rows)
+
+                metadata = {
+                    "last_updated": datetime.now().isoformat(),
+                    "last_modified": self._last_modified,
+                    "etag": self._etag,
+                }
+
+                # Written after the bills, so a cached session always has its
+                # bills stored
+                with self._db as conn:
+                    conn.execute("BEGIN IMMEDIATE")
+                    conn.executemany(
+                        "INSERT OR REPLACE INTO metadata (key, value) VALUES (?, ?)",
+                        metadata.items(),
+                    )
+                    conn.executemany(
+                        "INSERT OR REPLACE INTO session_cache VALUES (?, ?, ?, ?, ?)",
+                        self._session_cache_updates,
+                    )
+                self._session_cache_updates.clear()
+                self._saved_validators = validators
+
+            logger.info(
+                f"Database saved with {len(self.bills)} bills "
+                f"({len(dirty_bills)} changed, {states_saved} new states)."
+            )
+        except Exception as e:
+            logger.error(f"Failed to save database: {e}")
+
+    def _session_exists(self, session_url: str) -> bool:
+        """Cheaply check whether a session exists with a HEAD request.
+
+        Network errors count as "exists" so the full GET makes the final call.
+        """
         try:
-            data = {
-                "last_updated": datetime.now().isoformat(),
-                "bills": [bill.to_dict() for bill in self.bills.values()],
+            response = self._http.head(session_url, timeout=5)
+        except requests.RequestException:
+            return True
+        return response.status_code != 404
+
+    def _read_session_cache(self) -> Dict[str, Tuple]:
+        """Load cached (etag, last_modified, body_len) validators per session."""
+        with self._db_lock:
+            return {
+                session_id: tuple(validators)
+                for session_id, *validators in self._db.execute(
+                    "SELECT session_id, etag, last_modified, body_len FROM session_cache"
+                )
             }
 
-            with open(DB_FILE, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+    def _fetch_session_xml(
+        self,
+        session_id: str,
+        probe: bool = False,
+        cached: Optional[Tuple] = None,
+    ) -> Optional[_SessionFetch]:
+        """Download the bills XML for one historical session.
+
+        Runs on a worker thread; parsing happens in a separate process (see
+        _parse_session_bytes).
+
+        Args:
+            session_id: Session code, e.g. "44-1"
+            probe: Send a HEAD request first and skip the GET if the session
+                doesn't exist (for sessions not in _KNOWN_SESSIONS)
+            cached: (etag, last_modified, body_len) from the last successful
+                fetch of this session, replayed as conditional GET headers
+
+        Returns:
+            The downloaded body and its validators, a _SessionFetch with no
+            body if the session is unchanged since the cached fetch, or None
+            if the session doesn't exist or couldn't be fetched
+        """
+        session_url = f"https://www.parl.ca/legisinfo/en/bills/xml?parlsession={session_id}"
+
+        headers = {}
+        if cached:
+            cached_etag, cached_last_modified, cached_len = cached
+            if cached_etag:
+                headers["If-None-Match"] = cached_etag
+            if cached_last_modified:
+                headers["If-Modified-Since"] = cached_last_modified
+
+        try:
+            if probe and not self._session_exists(session_url):
+                return None
+
+            with self._http.get(
+                session_url, headers=headers, timeout=HTTP_TIMEOUT, stream=True
+            ) as response:
+                # If session doesn't exist, we'll get 404 or empty response
+                if response.status_code == 404:
+                    return None
+
+                if response.status_code == 304:
+                    result = _SessionFetch(body=None)
+                else:
+                    response.raise_for_status()
+                    etag = response.headers.get("ETag")
+                    last_modified = response.headers.get("Last-Modified")
+
+                    # Servers that ignore conditional headers: compare the
+                    # validators ourselves before downloading the body
+                    content_length = response.headers.get("Content-Length")
+                    same_length = (
+                        content_length is not None
+                        and cached is not None
+                        and int(content_length) == cached_len
+                    )
+                    if cached and (
+                        (etag and etag == cached_etag)
+                        or (
+                            same_length
+                            and last_modified
+                            and last_modified == cached_last_modified
+                        )
+                    ):
+                        result = _SessionFetch(body=None)
+                    else:
+                        body = response.content
+                        if not body:
+                            return None
+                        result = _SessionFetch(body, etag, last_modified)
+
+            # Be respectful to the API
+            time.sleep(HISTORICAL_REQUEST_DELAY_SECONDS)
 
-            logger.info(f"Database saved with {len(self.bills)} bills.")
+            return result
+
+        except requests.RequestException:
+            # Session doesn't exist or network issue
+            return None
         except Exception as e:
-            logger.error(f"Failed to save database: {e}")
+            logger.warning(f"Error fetching session {session_id}: {e}")
+            return None
+
+    def _fetch_historical_bills(self, use_cache: bool = True) -> None:
+        """Fetch all bills from historical parliamentary sessions.
+
+        Session downloads run concurrently on threads and the CPU-bound XML
+        parsing in a process pool; results are then applied to self.bills on
+        the calling thread in parliament/session order. Parse workers are
+        spawned rather than forked, since they start while the fetcher threads
+        are mid-request and would otherwise also inherit the open database.
 
-    def _fetch_historical_bills(self) -> None:
-        """Fetch all bills from historical parliamentary sessions."""
+        Args:
+            use_cache: Replay the session_cache validators so unchanged
+                sessions are skipped; False re-downloads every session
+        """
         logger.info("=" * 60)
         logger.info("HISTORICAL BILL FETCH - This may take several minutes...")
         logger.info("=" * 60)
 
         total_fetched = 0
 
+        # Dissolved parliaments have a fixed, known number of sessions; the
+        # current parliament (which may gain sessions) and unlisted ones are
+        # probed up to MAX_SESSIONS_PER_PARLIAMENT
+        sessions_to_fetch = []
         for parliament_num in HISTORICAL_PARLIAMENTS:
-            # Most parliaments have 1-2 sessions, some have more
-            for session_num in range(1, 5):  # Try up to 4 sessions per parliament
-                session_id = f"{parliament_num}-{session_num}"
-
-                try:
-                    # Build session-specific URL
-                    session_url = f"https://www.parl.ca/legisinfo/en/bills/xml?parlsession={parliament_num}-{session_num}"
+            known_sessions = _KNOWN_SESSIONS.get(parliament_num)
+            probe = known_sessions is None or parliament_num == CURRENT_PARLIAMENT
+            num_sessions = MAX_SESSIONS_PER_PARLIAMENT if probe else known_sessions
+            sessions_to_fetch.extend(
+                (f"{parliament_num}-{session_num}", probe)
+                for session_num in range(1, num_sessions + 1)
+            )
 
-                    logger.info(f"Fetching Parliament {session_id}...")
-                    response = requests.get(session_url, timeout=30)
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=HISTORICAL_FETCH_WORKERS
+        ) as fetcher, concurrent.futures.ProcessPoolExecutor(
+            max_workers=HISTORICAL_PARSE_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+        ) as parser:
+            session_cache = self._read_session_cache() if use_cache else {}
+            downloads = {
+                session_id: fetcher.submit(
+                    self._fetch_session_xml,
+                    session_id,
+                    probe,
+                    session_cache.get(session_id),
+                )
+                for session_id, probe in sessions_to_fetch
+            }
 
-                    # If session doesn't exist, we'll get 404 or empty response
-                    if response.status_code == 404:
-                        break  # No more sessions for this parliament
+            # Hand each body to the parser pool as soon as it has downloaded
+            parses = {}
+            validators = {}
+            for session_id, download in downloads.items():
+                fetch = download.result()
+                if fetch is None:
+                    continue
+                if fetch.body is None:
+                    logger.info(f"Parliament {session_id} unchanged, skipping.")
+                    continue
+                validators[session_id] = (
+                    fetch.etag,
+                    fetch.last_modified,
+                    len(fetch.body),
+                )
+                parses[session_id] = parser.submit(
+                    _parse_session_bytes, fetch.body, session_id
+                )
 
-                    response.raise_for_status()
+            for session_id, parse in parses.items():
+                bill_data_list = parse.result()
+                logger.info(f"Processing Parliament {session_id}...")
 
-                    # Try to parse - if empty or invalid, move on
-                    try:
-                        root = ET.fromstring(response.content)
-                    except ET.ParseError:
+                # Session has no bills or its XML couldn't be parsed
+                if not bill_data_list:
+                    if bill_data_list is None:
                         logger.warning(f"Could not parse XML for session {session_id}")
-                        break
-
-                    ns = (
-                        {"ns": root.tag.split("}")[0].strip("{")}
-                        if "}" in root.tag
-                        else {}
-                    )
-
-                    session_count = 0
-                    for bill_elem in root.iter():
-                        if "Bill" in bill_elem.tag:
-                            try:
-                                bill_data = self._parse_bill_element(bill_elem, ns)
-                                if bill_data:
-                                    self._process_bill(bill_data, suppress_new_log=True)
-                                    session_count += 1
-                            except Exception as e:
-                                logger.debug(
-                                    f"Failed to parse bill in {session_id}: {e}"
-                                )
-
-                    if session_count == 0:
-                        break  # Empty session, likely end of this parliament
-
-                    total_fetched += session_count
-                    logger.info(f"  → Added {session_count} bills from {session_id}")
+                    continue
 
-                    # Be respectful to the API
-                    time.sleep(1)
+                session_count = 0
+                now = int(time.time())
+                for bill_data in bill_data_list:
+                    try:
+                        self._process_bill(
+                            bill_data, suppress_new_log=True, timestamp=now
+                        )
+                        session_count += 1
+                    except Exception as e:
+                        logger.debug("Failed to process bill in %s: %s", session_id, e)
 
-                except requests.RequestException:
-                    # Session doesn't exist or network issue
-                    break
-                except Exception as e:
-                    logger.warning(f"Error fetching session {session_id}: {e}")
-                    break
+                total_fetched += session_count
+                logger.info(f"  → Added {session_count} bills from {session_id}")
+                self._session_cache_updates.append(
+                    (session_id, *validators[session_id], datetime.now().isoformat())
+                )
 
         logger.info("=" * 60)
         logger.info(f"Historical fetch complete: {total_fetched} bills added")
@@ -886,11 +1607,17 @@ class BillTracker:
         Only monitors bills from the current parliament. Historical bills are
         preserved but not actively polled.
         """
+        self._last_poll_changes = None
         try:
             logger.info("Fetching current bills from LEGISinfo API...")
 
             # Fetch and parse current bills
-            all_bill_data = self._fetch_current_bills_xml()
+            all_bill_data = self._fetch_current_bills_xml(conditional=True)
+
+            if all_bill_data is None:
+                logger.info("Bills unchanged since last poll (HTTP 304).")
+                self._last_poll_changes = 0
+                return
 
             if not all_bill_data:
                 logger.warning("No bills fetched from API.")
@@ -905,24 +1632,28 @@ class BillTracker:
             bills_processed = 0
             changes_detected = 0
             current_parliament_bills = set()
+            now = int(time.time())  # One timestamp for every state this poll
 
             # Process the bills
             for bill_data in all_bill_data:
                 try:
                     # Only process bills from current parliament
-                    session = bill_data["session"]
-                    parliament_num = int(session.split("-")[0])
+                    parliament_num = bill_data["parliament_num"]
 
                     if parliament_num == CURRENT_PARLIAMENT:
-                        unique_key = f"{session}-{bill_data['bill_id']}"
+                        unique_key = f"{bill_data['session']}-{bill_data['bill_id']}"
                         current_parliament_bills.add(unique_key)
-                        changed = self._process_bill(bill_data)
+                        changed = self._process_polled_bill(
+                            unique_key, bill_data, now
+                        )
                         bills_processed += 1
                         if changed:
                             changes_detected += 1
                     else:
                         logger.debug(
-                            f"Skipping historical bill {bill_data['bill_id']} from parliament {parliament_num}"
+                            "Skipping historical bill %s from parliament %s",
+                            bill_data["bill_id"],
+                            parliament_num,
                         )
                 except Exception as e:
                     logger.warning(f"Failed to process bill: {e}")
@@ -934,6 +1665,7 @@ class BillTracker:
                 f"Processed {bills_processed} active bills. "
                 f"Changes detected: {changes_detected}"
             )
+            self._last_poll_changes = changes_detected
 
             # Save after processing
             self._save_database()
@@ -949,7 +1681,16 @@ class BillTracker:
         Canadian parliamentary rule: Bills that don't receive Royal Assent before
         a parliament/session ends die on the order paper and must be reintroduced
         as new bills in the next session.
+
+        A scan leaves no live bill from an old parliament, and bills are never
+        removed or revived, so the next scan can only find something once bills
+        were added or CURRENT_PARLIAMENT moved on. Other polls skip the scan.
         """
+        watermark = (len(self.bills), CURRENT_PARLIAMENT)
+        if watermark == self._lifecycle_checked:
+            return
+        self._lifecycle_checked = watermark
+
         for unique_key, bill in self.bills.items():
             # Skip if bill already marked as inactive
             if not bill.is_active:
@@ -971,19 +1712,24 @@ class BillTracker:
                     )
                     bill.is_active = False
                     bill.died_on_order_paper = True
+                    bill.dirty = True
 
-    def _parse_bill_element(self, elem: ET.Element, ns: Dict) -> Optional[Dict]:
+    @staticmethod
+    def _parse_bill_element(elem: LET._Element) -> Optional[Dict]:
         """Extract bill data from XML element."""
 
-        def safe_find(path: str) -> Optional[str]:
-            """Safely find element text, handling namespaces and missing elements."""
-            try:
-                found = elem.find(path)
-                if found is not None and found.text:
-                    return found.text.strip()
-            except:
-                pass
-            return None
+        # Index direct children by local tag name in a single pass rather than
+        # a find() per field. As with find(), the first occurrence wins.
+        fields: Dict[str, Optional[str]] = {}
+        for child in elem:
+            tag = child.tag
+            if not isinstance(tag, str):
+                continue  # Comments / processing instructions
+            name = tag.rsplit("}", 1)[-1]
+            if name not in fields:
+                fields[name] = child.text.strip() if child.text else None
+
+        safe_find = fields.get
 
         # Extract data from the actual XML structure
         bill_number = safe_find("BillNumberFormatted")  # e.g., "C-11" or "S-1"
@@ -1016,31 +1762,30 @@ class BillTracker:
         # Chamber information
         chamber_id = safe_find("OriginatingChamberId")
         if chamber_id == "1":
-            chamber = "House of Commons"
+            chamber = CHAMBER_HOUSE
         elif chamber_id == "2":
-            chamber = "Senate"
+            chamber = CHAMBER_SENATE
         else:
-            chamber = safe_find("Chamber") or "Unknown"
+            chamber = sys.intern(safe_find("Chamber") or "Unknown")
 
         if not bill_number or not session_code:
             return None
 
         text_url = f"https://www.parl.ca/legisinfo/en/bill/{session_code}/{bill_number}"
 
+        # Parliament number ("44" of "44-1"), split once here for every consumer
+        parliament_prefix = session_code.split("-", 1)[0]
+        parliament_num = int(parliament_prefix) if parliament_prefix.isdigit() else None
+
         # New tracking fields
         sponsor = safe_find("SponsorEn")
         sponsor_affiliation = safe_find("PoliticalAffiliationId")
         royal_assent_date = safe_find("ReceivedRoyalAssentDateTime")
         last_activity_date = safe_find("LatestActivityDateTime")
 
-        # Count publications (for amendment detection)
-        publication_count = 0
-        try:
-            # Count all Publication elements under this bill
-            for pub in elem.findall(".//Publication"):
-                publication_count += 1
-        except:
-            pass
+        # Count all Publication elements under this bill (for amendment
+        # detection); the XPath count() runs in C and never raises on absence
+        publication_count = int(_COUNT_PUBLICATIONS(elem))
 
         # Check for royal recommendation (typically indicated by MinistryId or certain bill types)
         ministry_id = safe_find("MinistryId")
@@ -1052,6 +1797,7 @@ class BillTracker:
         return {
             "bill_id": bill_number,
             "session": session_code,
+            "parliament_num": parliament_num,
             "title": title,
             "status_code": status_code,
             "status_text": status_text,
@@ -1065,14 +1811,20 @@ class BillTracker:
             "publication_count": publication_count,
         }
 
-    def _process_bill(self, bill_data: Dict, suppress_new_log: bool = False) -> bool:
+    def _process_bill(
+        self,
+        bill_data: Dict,
+        suppress_new_log: bool = False,
+        timestamp: Optional[int] = None,
+    ) -> bool:
         """Process a bill, updating or creating as needed."""
         session = bill_data["session"]
         bill_id = bill_data["bill_id"]
         unique_key = f"{session}-{bill_id}"
 
-        # Get or create bill
-        if unique_key not in self.bills:
+        # Get or create bill (single O(1) probe of the unique_key index)
+        bill = self.bills.get(unique_key)
+        if bill is None:
             bill = Bill(
                 session=session,
                 bill_id=bill_id,
@@ -1092,7 +1844,13 @@ class BillTracker:
                     f"📝 New bill tracked: {bill_id} ({bill.bill_type}){sponsor_info} - {bill_data['title'][:50]}"
                 )
         else:
-            bill = self.bills[unique_key]
+            metadata_before = (
+                bill.sponsor,
+                bill.sponsor_affiliation,
+                bill.royal_assent_date,
+                bill.last_activity_date,
+                bill.has_royal_recommendation,
+            )
             # Update metadata that might change
             bill.sponsor = bill_data.get("sponsor") or bill.sponsor
             bill.sponsor_affiliation = (
@@ -1107,6 +1865,14 @@ class BillTracker:
             bill.has_royal_recommendation = bill_data.get(
                 "has_royal_recommendation", bill.has_royal_recommendation
             )
+            if metadata_before != (
+                bill.sponsor,
+                bill.sponsor_affiliation,
+                bill.royal_assent_date,
+                bill.last_activity_date,
+                bill.has_royal_recommendation,
+            ):
+                bill.dirty = True
 
         # Update and check for changes
         return bill.update(
@@ -1115,36 +1881,125 @@ class BillTracker:
             chamber=bill_data["chamber"],
             text_url=bill_data["text_url"],
             publication_count=bill_data.get("publication_count", 0),
+            timestamp=timestamp,
         )
 
+    def _metrics_loop(self, interval_seconds: float) -> None:
+        """Log poll health periodically until the daemon stops."""
+        while not self._stop_event.wait(interval_seconds):
+            last_poll = (
+                f"{self._last_poll_seconds:.1f}s"
+                if self._last_poll_seconds is not None
+                else "n/a"
+            )
+            logger.info(
+                f"📊 Polls: {self._poll_count} | Errors: {self._poll_errors} | "
+                f"Last poll: {last_poll} | Bills tracked: {len(self.bills)}"
+            )
+
+    def stop(self) -> None:
+        """Ask a running daemon loop (and its metrics thread) to exit."""
+        self._stop_event.set()
+
     def run_daemon(self, time_delay_seconds: float = POLL_INTERVAL_HOURS) -> None:
-        """Main daemon loop - polls indefinitely."""
+        """Main daemon loop - polls until stopped.
+
+        Waits between polls on an Event rather than sleeping, so stop() takes
+        effect immediately; a background thread reports poll metrics.
+
+        The wait starts at time_delay_seconds and adapts to activity: it drops
+        to MIN_POLL_HOURS after a poll that found changes, and doubles (up to
+        MAX_POLL_HOURS) after every IDLE_POLLS_BEFORE_BACKOFF idle polls.
+        """
         logger.info("=" * 60)
         logger.info("Canadian Legislative Bill Tracker - STARTED")
         logger.info(f"Poll interval: {round(time_delay_seconds / 3600, 2)} hours")
         logger.info("=" * 60)
 
-        while True:
-            try:
-                self.fetch_and_process_bills()
+        self._stop_event.clear()
+        metrics_thread = threading.Thread(
+            target=self._metrics_loop,
+            args=(METRICS_INTERVAL_SECONDS,),
+            daemon=True,
+        )
+        metrics_thread.start()
 
-                sleep_seconds = time_delay_seconds
-                next_poll = datetime.now().replace(microsecond=0)
-                next_poll = next_poll.timestamp() + sleep_seconds
-                next_poll_str = datetime.fromtimestamp(next_poll).strftime(
-                    "%Y-%m-%d %H:%M:%S"
-                )
+        consecutive_errors = 0
+        idle_polls = 0
+        poll_interval = time_delay_seconds
+        min_interval = min(time_delay_seconds, MIN_POLL_HOURS * 3600)
+        max_interval = max(time_delay_seconds, MAX_POLL_HOURS * 3600)
+        try:
+            while not self._stop_event.is_set():
+                try:
+                    poll_start = time.monotonic()
+                    self.fetch_and_process_bills()
+                    self._last_poll_seconds = time.monotonic() - poll_start
+                    self._poll_count += 1
+                    consecutive_errors = 0
+
+                    if self._last_poll_seconds > SLOW_POLL_SECONDS:
+                        logger.warning(
+                            f"🐢 Slow poll: {self._last_poll_seconds:.1f}s "
+                            f"(threshold {SLOW_POLL_SECONDS}s)"
+                        )
 
-                logger.info(f"Sleeping until next poll at {next_poll_str}")
-                time.sleep(sleep_seconds)
+                    # Adapt to activity; polls that didn't complete leave the
+                    # interval alone
+                    if self._last_poll_changes:
+                        idle_polls = 0
+                        poll_interval = min_interval
+                    elif self._last_poll_changes == 0:
+                        idle_polls += 1
+                        if idle_polls >= IDLE_POLLS_BEFORE_BACKOFF:
+                            idle_polls = 0
+                            poll_interval = min(poll_interval * 2, max_interval)
+
+                    # Jitter the interval so separate trackers (or restarts
+                    # after an outage) don't poll LEGISinfo in lockstep
+                    jitter = poll_interval * POLL_JITTER_FRACTION
+                    sleep_seconds = poll_interval + random.uniform(-jitter, jitter)
+                    next_poll = datetime.now().replace(microsecond=0)
+                    next_poll = next_poll.timestamp() + sleep_seconds
+                    next_poll_str = datetime.fromtimestamp(next_poll).strftime(
+                        "%Y-%m-%d %H:%M:%S"
+                    )
 
-            except KeyboardInterrupt:
-                logger.info("\n🛑 Daemon stopped by user.")
-                break
-            except Exception as e:
-                logger.error(f"Unexpected error in daemon loop: {e}")
-                logger.info("Retrying in 5 minutes...")
-                time.sleep(300)  # Wait 5 minutes before retry
+                    logger.info(f"Sleeping until next poll at {next_poll_str}")
+                    self._stop_event.wait(sleep_seconds)
+
+                except Exception as e:
+                    self._poll_errors += 1
+                    logger.error(f"Unexpected error in daemon loop: {e}")
+                    # Exponential backoff with full jitter
+                    delay = min(
+                        ERROR_RETRY_MAX_SECONDS,
+                        ERROR_RETRY_SECONDS * 2**consecutive_errors,
+                    )
+                    consecutive_errors += 1
+                    retry_seconds = random.uniform(0, delay)
+                    logger.info(f"Retrying in {retry_seconds:.0f} seconds...")
+                    self._stop_event.wait(retry_seconds)
+        except KeyboardInterrupt:
+            logger.info("\n🛑 Daemon stopped by user.")
+        finally:
+            self.stop()
+            metrics_thread.join(timeout=5)
+
+
+def _parse_session_bytes(xml_bytes: bytes, session_id: str) -> Optional[List[Dict]]:
+    """Parse one session's XML body into bill data dictionaries.
+
+    Module-level so ProcessPoolExecutor can pickle it; only plain dicts cross
+    the process boundary.
+
+    Returns:
+        List of parsed bill data dictionaries, or None if the XML is malformed
+    """
+    try:
+        return BillTracker._parse_bills_xml(io.BytesIO(xml_bytes), session_id)
+    except LET.XMLSyntaxError:
+        return None
 
 
 def main():
@@ -1185,7 +2040,7 @@ Examples:
     # If force-historical is set, fetch regardless of database state
     if args.force_historical:
         logger.info("Force historical fetch requested...")
-        tracker._fetch_historical_bills()
+        tracker._fetch_historical_bills(use_cache=False)
 
     tracker.run_daemon(time_delay_seconds=POLL_INTERVAL_HOURS * 3600)
     # tracker.run_daemon(time_delay_seconds=30)
@@ -12,14 +12,16 @@ Tests cover:
 - Historical bill fetching
 """
 
+import io
 import json
 import shutil
+import sqlite3
 import tempfile
 import time
+from contextlib import closing
 from datetime import datetime
 from pathlib import Path
 from unittest.mock import MagicMock, Mock, patch
-from xml.etree import ElementTree as ET
 
 import pytest
 import requests
@@ -36,11 +38,19 @@ from main import (
     BillState,
     BillTracker,
     CIFStatus,
+    ERROR_RETRY_SECONDS,
     analyze_coming_into_force,
     extract_chapter_citation,
     process_passed_bill,
 )
-from utils import calculate_days_since, load_bills
+from utils import (
+    bill_shards_current,
+    build_bill_shards,
+    calculate_days_since,
+    database_mtime,
+    load_bill_shard,
+    load_bills,
+)
 
 
 # ============================================================================
@@ -60,7 +70,7 @@ def temp_dir():
 @pytest.fixture
 def mock_db_file(temp_dir, monkeypatch):
     """Mock the database file path."""
-    db_path = temp_dir / "test_bills_db.json"
+    db_path = temp_dir / "test_bills.sqlite"
     storage_dir = temp_dir / "assets"
     storage_dir.mkdir(exist_ok=True)
 
@@ -74,6 +84,26 @@ def mock_db_file(temp_dir, monkeypatch):
     return db_path
 
 
+@pytest.fixture
+def tracker_db(mock_db_file, monkeypatch):
+    """Point the lookup utilities at the tracker's (mocked) database."""
+    import utils
+
+    monkeypatch.setattr(utils, "BILLS_DB_PATH", str(mock_db_file))
+    return mock_db_file
+
+
+def save_bills(bill_dicts) -> None:
+    """Write bills to the tracker's database as BillTracker would."""
+    with patch.object(BillTracker, "_fetch_current_bills_xml", return_value=[]):
+        tracker = BillTracker(fetch_historical=False)
+    for bill_data in bill_dicts:
+        bill = Bill.from_dict(bill_data)
+        tracker.bills[bill.unique_key] = bill
+    tracker._save_database()
+    tracker._db.close()
+
+
 @pytest.fixture
 def sample_bill_data():
     """Generate sample bill data for testing."""
@@ -117,6 +147,17 @@ def sample_bill_data():
     }
 
 
+def make_xml_response(xml: str, headers=None) -> MagicMock:
+    """Build a mock HTTP response carrying an XML body (streamed or not)."""
+    response = MagicMock()
+    response.__enter__.return_value = response
+    response.status_code = 200
+    response.headers = headers or {}
+    response.content = xml.encode()
+    response.raw = io.BytesIO(response.content)
+    return response
+
+
 @pytest.fixture
 def sample_xml_response():
     """Generate sample XML response from API."""
@@ -180,6 +221,19 @@ class TestBillState:
         assert state_dict["status_code"] == "100"
         assert state_dict["chamber"] == "House of Commons"
 
+    def test_bill_state_converts_iso_timestamp(self):
+        """Test legacy ISO timestamps become epoch seconds and round-trip."""
+        state = BillState(
+            status_code="100",
+            status_text="First reading",
+            timestamp="2024-01-10T10:00:00",
+            chamber="House of Commons",
+            text_url="https://example.com/bill.pdf",
+        )
+
+        assert isinstance(state.timestamp, int)
+        assert state.to_dict()["timestamp"] == "2024-01-10T10:00:00"
+
     def test_bill_state_immutable(self):
         """Test that BillState is immutable (frozen)."""
         state = BillState(
@@ -296,6 +350,18 @@ class TestBill:
         assert changed is False
         assert len(bill.history) == 1
 
+    def test_update_bill_royal_assent_with_same_status(self):
+        """Test a newly recorded Royal Assent date moves an unchanged status."""
+        bill = Bill(session="44-1", bill_id="C-11", title="Test Bill")
+        args = ("300", "Third reading", "House of Commons", "https://example.com")
+        bill.update(*args)
+
+        bill.royal_assent_date = "2024-06-01T10:00:00"
+
+        assert bill.update(*args) is True
+        assert bill.current_stage == "ROYAL_ASSENT"
+        assert bill.update(*args) is False
+
     def test_update_bill_status_change(self):
         """Test updating a bill when status changes."""
         bill = Bill(session="44-1", bill_id="C-11", title="Test Bill")
@@ -318,6 +384,26 @@ class TestBill:
         assert len(bill.history) == 2
         assert bill.current_stage == "SECOND_READING"
 
+    def test_update_records_status_stage_after_chamber_switch(self):
+        """Test the poll after a chamber switch still records the status stage."""
+        bill = Bill(session="44-1", bill_id="C-11", title="Test Bill")
+        bill.update("1", "At third reading", "House of Commons", "u")
+        bill.update("2", "At second reading in the Senate", "Senate", "u")
+        assert bill.update("2", "At second reading in the Senate", "Senate", "u")
+        assert not bill.update("2", "At second reading in the Senate", "Senate", "u")
+
+        stages = [state.stage for state in bill.history]
+        assert stages == ["FIRST_READING", "SENATE_STAGES", "SECOND_READING"]
+
+    def test_update_records_royal_assent_status_after_chamber_switch(self):
+        """Test a royal assent status isn't stuck on SENATE_STAGES."""
+        bill = Bill(session="44-1", bill_id="C-11", title="Test Bill")
+        bill.update("1", "At third reading", "House of Commons", "u")
+        bill.update("9", "Royal assent received", "Senate", "u")
+        bill.update("9", "Royal assent received", "Senate", "u")
+
+        assert bill.history[-1].stage == "ROYAL_ASSENT"
+
     def test_determine_stage_transition_chamber_switch(self):
         """Test stage determination when bill moves to Senate."""
         bill = Bill(session="44-1", bill_id="C-11", title="Test Bill")
@@ -410,6 +496,36 @@ class TestRoyalAssentProcessing:
         citation = extract_chapter_citation(bill_text, metadata)
         assert citation == "S.C. 2024, c. 42"
 
+    def test_extract_chapter_citation_variants(self):
+        """Test every accepted citation spelling maps to the canonical form."""
+        for text in (
+            "S.C. 2024, c. 15",
+            "S.C. 2024, ch. 15",
+            "S.C. 2024, c 15",
+            "s.c. 2024 c. 15",
+            "Statutes of Canada 2024 Chapter 15",
+            "Statutes of  Canada 2024, chapter 15",
+        ):
+            assert extract_chapter_citation(text, {}) == "S.C. 2024, c. 15", text
+
+    def test_extract_chapter_citation_prefers_leftmost(self):
+        """Test the first citation in a string wins, whichever spelling it uses."""
+        text = (
+            "Statutes of Canada 2023, c. 4 ... "
+            "Statutes of Canada 2024 Chapter 15 ... S.C. 2025, c. 1"
+        )
+        assert extract_chapter_citation(text, {}) == "S.C. 2023, c. 4"
+
+    def test_extract_chapter_citation_from_nested_metadata(self):
+        """Test citations are found in nested metadata values before the text."""
+        metadata = {
+            "title": "An Act",
+            "publications": [{"note": "Assented to as S.C. 2023, c. 7"}],
+        }
+
+        citation = extract_chapter_citation("S.C. 2024, c. 15", metadata)
+        assert citation == "S.C. 2023, c. 7"
+
     def test_extract_chapter_citation_not_found(self):
         """Test when chapter citation is not found."""
         bill_text = "No chapter citation in this text"
@@ -451,6 +567,17 @@ class TestRoyalAssentProcessing:
         assert status == CIFStatus.FIXED_DATE.name
         assert "January" in details or "2025" in details
 
+    def test_analyze_coming_into_force_cue_precedence(self):
+        """Test that order and "to be fixed" cues outrank date mentions."""
+        cases = {
+            "Commencement: in force on a day to be fixed by order.": "WAITING_FOR_ORDER",
+            "Commencement: 2025, or a later day to be fixed.": "WAITING_FOR_ORDER",
+            "Commencement: to be fixed, on royal assent.": "ACTIVE_ON_ASSENT",
+            "Commencement: on royal assent or June 1, 2025.": "FIXED_DATE",
+        }
+        for bill_text, expected in cases.items():
+            assert analyze_coming_into_force(bill_text)[0] == expected, bill_text
+
     def test_analyze_coming_into_force_no_section(self):
         """Test CIF analysis when no CIF section found."""
         bill_text = "Just some regular bill text without CIF section."
@@ -528,12 +655,79 @@ class TestBillTracker:
             # Load in new tracker
             with patch.object(BillTracker, "_fetch_current_bills_xml", return_value=[]):
                 tracker2 = BillTracker(fetch_historical=False)
-                # Force reload from saved file
-                with open(mock_db_file, "r", encoding="utf-8") as f:
-                    data = json.load(f)
 
-                assert len(data["bills"]) == 1
-                assert data["bills"][0]["bill_id"] == "C-11"
+                assert list(tracker2.bills) == ["44-1-C-11"]
+                loaded = tracker2.bills["44-1-C-11"]
+                assert loaded.to_dict() == bill.to_dict()
+                assert loaded.dirty is False
+
+    def test_load_migrates_legacy_json_database(self, mock_db_file, sample_bill_data):
+        """Test that a pre-SQLite JSON database is imported on first load."""
+        import main
+
+        legacy_file = main.STORAGE_DIR / main.LEGACY_DB_NAME
+        legacy_data = {"etag": '"v1"', "bills": [sample_bill_data]}
+        legacy_file.write_text(json.dumps(legacy_data))
+
+        with patch.object(BillTracker, "_fetch_current_bills_xml", return_value=[]):
+            BillTracker(fetch_historical=False)
+            assert mock_db_file.exists()
+
+            tracker = BillTracker(fetch_historical=False)
+
+        assert tracker._etag == '"v1"'
+        assert tracker.bills["44-1-C-11"].to_dict() == sample_bill_data
+
+    def test_save_database_only_writes_dirty_bills(self, mock_db_file):
+        """Test that saves skip unchanged bills and only append new states."""
+        with patch.object(BillTracker, "_fetch_current_bills_xml", return_value=[]):
+            tracker = BillTracker(fetch_historical=False)
+
+            old_bill = Bill(session="43-2", bill_id="C-5", title="Old Bill")
+            new_bill = Bill(session="44-1", bill_id="C-11", title="New Bill")
+            tracker.bills[old_bill.unique_key] = old_bill
+            tracker.bills[new_bill.unique_key] = new_bill
+            tracker._save_database()
+            assert not old_bill.dirty and not new_bill.dirty
+
+            with closing(sqlite3.connect(mock_db_file)) as conn, conn:
+                conn.execute("UPDATE bills SET title = 'Sentinel'")
+
+            new_bill.update("100", "First reading", "House of Commons", "")
+            tracker._save_database()
+            new_bill.update("200", "Second reading", "House of Commons", "")
+            tracker._save_database()
+
+            with closing(sqlite3.connect(mock_db_file)) as conn:
+                titles = dict(conn.execute("SELECT unique_key, title FROM bills"))
+                states = conn.execute(
+                    "SELECT seq, status_code FROM bill_states ORDER BY seq"
+                ).fetchall()
+
+            # The untouched bill keeps its (sentinel) row
+            assert titles == {"43-2-C-5": "Sentinel", "44-1-C-11": "New Bill"}
+            assert states == [(0, "100"), (1, "200")]
+
+    def test_save_database_skips_write_when_nothing_changed(self, mock_db_file):
+        """Test that an idle save leaves the database untouched."""
+        with patch.object(BillTracker, "_fetch_current_bills_xml", return_value=[]):
+            tracker = BillTracker(fetch_historical=False)
+            tracker._save_database()
+
+            with closing(sqlite3.connect(mock_db_file)) as conn, conn:
+                conn.execute("DELETE FROM metadata")
+
+            tracker._save_database()
+            with closing(sqlite3.connect(mock_db_file)) as conn:
+                assert conn.execute("SELECT COUNT(*) FROM metadata").fetchone()[0] == 0
+
+            tracker._etag = '"v2"'
+            tracker._save_database()
+            with closing(sqlite3.connect(mock_db_file)) as conn:
+                etag = conn.execute(
+                    "SELECT value FROM metadata WHERE key = 'etag'"
+                ).fetchone()[0]
+            assert etag == '"v2"'
 
     def test_detect_current_parliament(self, mock_db_file):
         """Test detecting current parliament number from bills."""
@@ -541,10 +735,11 @@ class TestBillTracker:
             tracker = BillTracker(fetch_historical=False)
 
             bill_data = [
-                {"session": "42-1", "bill_id": "C-1"},
-                {"session": "43-1", "bill_id": "C-2"},
-                {"session": "44-1", "bill_id": "C-3"},
-                {"session": "44-2", "bill_id": "C-4"},
+                {"session": "42-1", "parliament_num": 42, "bill_id": "C-1"},
+                {"session": "43-1", "parliament_num": 43, "bill_id": "C-2"},
+                {"session": "44-1", "parliament_num": 44, "bill_id": "C-3"},
+                {"session": "44-2", "parliament_num": 44, "bill_id": "C-4"},
+                {"session": "Unknown", "parliament_num": None, "bill_id": "C-5"},
             ]
 
             parliament = tracker._detect_current_parliament(bill_data)
@@ -577,6 +772,31 @@ class TestBillTracker:
             # Current bill should still be active
             assert current_bill.is_active is True
 
+    def test_lifecycle_scan_only_reruns_after_bills_added(
+        self, mock_db_file, sample_bill_data
+    ):
+        """Test the died-on-order-paper scan is skipped when nothing was added."""
+        with patch.object(BillTracker, "_fetch_current_bills_xml", return_value=[]):
+            tracker = BillTracker(fetch_historical=False)
+
+        first = Bill.from_dict({**sample_bill_data, "session": "43-1"})
+        tracker.bills[first.unique_key] = first
+        tracker._update_bill_lifecycle_status(set())
+        assert first.died_on_order_paper is True
+
+        # Same bills and parliament: the scan doesn't run again
+        first.is_active = True
+        first.died_on_order_paper = False
+        tracker._update_bill_lifecycle_status(set())
+        assert first.died_on_order_paper is False
+
+        # A newly added bill triggers a full scan
+        second = Bill.from_dict({**sample_bill_data, "session": "42-1"})
+        tracker.bills[second.unique_key] = second
+        tracker._update_bill_lifecycle_status(set())
+        assert first.died_on_order_paper is True
+        assert second.died_on_order_paper is True
+
     def test_process_bill_new(self, mock_db_file):
         """Test processing a new bill."""
         with patch.object(BillTracker, "_fetch_current_bills_xml", return_value=[]):
@@ -601,10 +821,8 @@ class TestBillTracker:
         self, mock_db_file, sample_xml_response
     ):
         """Test fetching bills and detecting changes."""
-        with patch("requests.get") as mock_get:
-            mock_response = MagicMock()
-            mock_response.content = sample_xml_response.encode()
-            mock_response.raise_for_status = MagicMock()
+        with patch("requests.Session.get") as mock_get:
+            mock_response = make_xml_response(sample_xml_response)
             mock_get.return_value = mock_response
 
             with patch.object(BillTracker, "_load_database"):
@@ -617,6 +835,192 @@ class TestBillTracker:
                 assert len(tracker.bills) > 0
 
 
+    def test_parse_bills_xml(self):
+        """Test streaming parse of only <Bill> elements, counting publications."""
+        xml = b"""<?xml version="1.0" encoding="UTF-8"?>
+<Bills>
+    <Bill>
+        <BillNumberFormatted>C-11</BillNumberFormatted>
+        <ParlSessionCode>44-1</ParlSessionCode>
+        <Publications><Publication/><Publication/></Publications>
+    </Bill>
+    <Bill>
+        <BillNumberFormatted>S-2</BillNumberFormatted>
+        <ParlSessionCode>44-1</ParlSessionCode>
+    </Bill>
+</Bills>"""
+
+        bills = BillTracker._parse_bills_xml(io.BytesIO(xml), "test")
+
+        assert [b["bill_id"] for b in bills] == ["C-11", "S-2"]
+        assert [b["publication_count"] for b in bills] == [2, 0]
+
+    def test_fetch_and_process_bills_not_modified(
+        self, mock_db_file, sample_xml_response
+    ):
+        """Test that validators are replayed and a 304 skips parsing and saving."""
+        with patch("requests.Session.get") as mock_get:
+            mock_response = make_xml_response(
+                sample_xml_response, {"ETag": '"abc"', "Last-Modified": "Mon"}
+            )
+            mock_get.return_value = mock_response
+
+            with patch.object(BillTracker, "_load_database"):
+                tracker = BillTracker(fetch_historical=False)
+                tracker.bills = {}
+                tracker.fetch_and_process_bills()
+
+            not_modified = make_xml_response("")
+            not_modified.status_code = 304
+            mock_get.return_value = not_modified
+            with patch.object(BillTracker, "_save_database") as mock_save:
+                tracker.fetch_and_process_bills()
+
+            sent_headers = mock_get.call_args.kwargs["headers"]
+            assert sent_headers["If-None-Match"] == '"abc"'
+            assert sent_headers["If-Modified-Since"] == "Mon"
+            mock_save.assert_not_called()
+
+    def test_fetch_historical_bills_uses_known_sessions(self, mock_db_file):
+        """Test that only known sessions are fetched and the current one is probed."""
+        xml = (
+            "<Bills><Bill><BillNumberFormatted>C-1</BillNumberFormatted>"
+            "<ParlSessionCode>{}</ParlSessionCode></Bill></Bills>"
+        )
+
+        def fake_get(url, **kwargs):
+            session_id = url.rsplit("=", 1)[-1]
+            return make_xml_response(xml.format(session_id))
+
+        def fake_head(url, **kwargs):
+            return MagicMock(status_code=200 if url.endswith("=44-1") else 404)
+
+        with patch.object(BillTracker, "_fetch_current_bills_xml", return_value=[]):
+            tracker = BillTracker(fetch_historical=False)
+
+        with patch("requests.Session.get", side_effect=fake_get) as mock_get, patch(
+            "requests.Session.head", side_effect=fake_head
+        ) as mock_head, patch("main.HISTORICAL_PARLIAMENTS", [37, 44]), patch(
+            "main.HISTORICAL_REQUEST_DELAY_SECONDS", 0
+        ):
+            tracker._fetch_historical_bills()
+
+        fetched = sorted(
+            call.args[0].rsplit("=", 1)[-1] for call in mock_get.call_args_list
+        )
+        assert fetched == ["37-1", "37-2", "37-3", "44-1"]
+        assert mock_head.call_count == 4  # Current parliament probed, 37 isn't
+        assert "44-1-C-1" in tracker.bills
+
+    def test_fetch_historical_bills_skips_unchanged_sessions(self, mock_db_file):
+        """Test that a re-run replays cached ETags and skips 304 sessions."""
+        xml = (
+            "<Bills><Bill><BillNumberFormatted>C-1</BillNumberFormatted>"
+            "<ParlSessionCode>38-1</ParlSessionCode></Bill></Bills>"
+        )
+
+        def fake_get(url, headers=None, **kwargs):
+            if (headers or {}).get("If-None-Match") == '"v1"':
+                not_modified = make_xml_response("")
+                not_modified.status_code = 304
+                return not_modified
+            return make_xml_response(xml, {"ETag": '"v1"'})
+
+        with patch.object(BillTracker, "_fetch_current_bills_xml", return_value=[]):
+            tracker = BillTracker(fetch_historical=False)
+
+        with patch("requests.Session.get", side_effect=fake_get), patch(
+            "main.HISTORICAL_PARLIAMENTS", [38]
+        ), patch("main.HISTORICAL_REQUEST_DELAY_SECONDS", 0):
+            tracker._fetch_historical_bills()
+            assert "38-1-C-1" in tracker.bills
+
+            with patch.object(tracker, "_process_bill") as mock_process:
+                tracker._fetch_historical_bills()
+                mock_process.assert_not_called()
+
+            # A forced refresh ignores the cached validators
+            with patch.object(tracker, "_process_bill") as mock_process:
+                tracker._fetch_historical_bills(use_cache=False)
+                mock_process.assert_called_once()
+
+    def test_run_daemon_stops_without_waiting_out_interval(self, mock_db_file):
+        """Test that stop() interrupts the daemon's wait between polls."""
+        with patch.object(BillTracker, "_fetch_current_bills_xml", return_value=[]):
+            tracker = BillTracker(fetch_historical=False)
+
+        with patch.object(
+            BillTracker, "fetch_and_process_bills", side_effect=tracker.stop
+        ):
+            start = time.monotonic()
+            tracker.run_daemon(time_delay_seconds=3600)
+
+        assert time.monotonic() - start < 5
+        assert tracker._poll_count == 1
+
+    def test_run_daemon_jitters_waits_and_backs_off_on_errors(self, mock_db_file):
+        """Test that poll waits are jittered and error retries back off."""
+        with patch.object(BillTracker, "_fetch_current_bills_xml", return_value=[]):
+            tracker = BillTracker(fetch_historical=False)
+
+        errors = iter([RuntimeError("boom"), RuntimeError("boom")])
+
+        def fake_poll():
+            error = next(errors, None)
+            if error is not None:
+                raise error
+            # First successful poll: stop so the jittered wait returns at once
+            tracker.stop()
+
+        # Record each randomized wait's bounds and wait zero seconds instead
+        bounds = []
+
+        def fake_uniform(low, high):
+            bounds.append((low, high))
+            return 0
+
+        with patch.object(
+            BillTracker, "fetch_and_process_bills", side_effect=fake_poll
+        ), patch("main.random.uniform", side_effect=fake_uniform):
+            tracker.run_daemon(time_delay_seconds=3600)
+
+        assert bounds == [
+            (0, ERROR_RETRY_SECONDS),
+            (0, ERROR_RETRY_SECONDS * 2),
+            (-180, 180),
+        ]
+        assert tracker._poll_errors == 2
+        assert tracker._poll_count == 1
+
+    def test_run_daemon_adapts_interval_to_change_rate(self, mock_db_file):
+        """Test idle polls stretch the interval and a change resets it."""
+        with patch.object(BillTracker, "_fetch_current_bills_xml", return_value=[]):
+            tracker = BillTracker(fetch_historical=False)
+
+        changes = iter([0, 0, 0, 0, 0, 0, 2])
+
+        def fake_poll():
+            tracker._last_poll_changes = next(changes, None)
+            if tracker._last_poll_changes is None:
+                tracker.stop()
+
+        intervals = []
+
+        def fake_uniform(low, high):
+            intervals.append(high / 0.05)  # Jitter is +/- 5% of the interval
+            return 0
+
+        with patch.object(
+            BillTracker, "fetch_and_process_bills", side_effect=fake_poll
+        ), patch("main.random.uniform", side_effect=fake_uniform), patch.object(
+            tracker._stop_event, "wait"
+        ):
+            tracker.run_daemon(time_delay_seconds=4 * 3600)
+
+        hours = [round(interval / 3600) for interval in intervals]
+        assert hours == [4, 4, 8, 8, 8, 16, 1, 1]
+
+
 # ============================================================================
 # Database Change Detection Tests
 # ============================================================================
@@ -697,6 +1101,103 @@ class TestDatabaseChangeDetection:
             assert changed is False
             assert len(bill.history) == 2  # No new history entry
 
+    def test_batch_skips_records_unchanged_since_last_poll(self, mock_db_file):
+        """Test that identical records from the previous poll aren't reprocessed."""
+        with patch.object(BillTracker, "_fetch_current_bills_xml", return_value=[]):
+            tracker = BillTracker(fetch_historical=False)
+
+            bill_data = {
+                "session": "44-1",
+                "parliament_num": 44,
+                "bill_id": "C-11",
+                "title": "An Act to amend the Broadcasting Act",
+                "status_code": "100",
+                "status_text": "First reading",
+                "chamber": "House of Commons",
+                "text_url": "https://example.com/bill.pdf",
+            }
+            assert tracker._process_bill_data_batch([bill_data]) == 1  # New bill
+
+            with patch.object(tracker, "_process_bill") as mock_process:
+                tracker._process_bill_data_batch([dict(bill_data)])
+                mock_process.assert_not_called()
+
+                tracker._process_bill_data_batch(
+                    [{**bill_data, "status_text": "Third reading"}]
+                )
+                mock_process.assert_called_once()
+
+    def test_poll_skips_records_unchanged_since_last_poll(self, mock_db_file):
+        """Test that repeated polls only reprocess records that changed."""
+        with patch.object(BillTracker, "_fetch_current_bills_xml", return_value=[]):
+            tracker = BillTracker(fetch_historical=False)
+
+        bill_data = {
+            "session": "44-1",
+            "parliament_num": 44,
+            "bill_id": "C-11",
+            "title": "An Act to amend the Broadcasting Act",
+            "status_code": "100",
+            "status_text": "First reading",
+            "chamber": "House of Commons",
+            "text_url": "https://example.com/bill.pdf",
+        }
+        polls = [
+            [bill_data],
+            [dict(reversed(bill_data.items()))],  # Same record, other key order
+            [{**bill_data, "status_text": "Third reading"}],
+        ]
+
+        with patch.object(
+            BillTracker, "_fetch_current_bills_xml", side_effect=polls
+        ), patch.object(
+            tracker, "_process_bill", wraps=tracker._process_bill
+        ) as mock_process:
+            tracker.fetch_and_process_bills()
+            assert mock_process.call_count == 1
+
+            tracker.fetch_and_process_bills()
+            assert mock_process.call_count == 1
+
+            tracker.fetch_and_process_bills()
+            assert mock_process.call_count == 2
+
+        assert len(tracker.bills["44-1-C-11"].history) == 2
+
+    def test_poll_reprocesses_identical_record_until_stage_settles(
+        self, mock_db_file
+    ):
+        """Test the poll skip waits for the status-derived stage after a switch."""
+        with patch.object(BillTracker, "_fetch_current_bills_xml", return_value=[]):
+            tracker = BillTracker(fetch_historical=False)
+
+        bill_data = {
+            "session": "44-1",
+            "parliament_num": 44,
+            "bill_id": "C-11",
+            "title": "An Act to amend the Broadcasting Act",
+            "status_code": "1",
+            "status_text": "At third reading",
+            "chamber": "House of Commons",
+            "text_url": "u",
+        }
+        senate = {
+            **bill_data,
+            "status_code": "2",
+            "status_text": "At second reading in the Senate",
+            "chamber": "Senate",
+        }
+        with patch.object(
+            BillTracker,
+            "_fetch_current_bills_xml",
+            side_effect=[[bill_data], [senate], [senate], [senate]],
+        ):
+            for _ in range(4):
+                tracker.fetch_and_process_bills()
+
+        stages = [state.stage for state in tracker.bills["44-1-C-11"].history]
+        assert stages == ["FIRST_READING", "SENATE_STAGES", "SECOND_READING"]
+
     def test_database_update_on_change(self, mock_db_file, sample_bill_data):
         """Test that database is updated when changes are detected."""
         with patch.object(BillTracker, "_fetch_current_bills_xml", return_value=[]):
@@ -707,9 +1208,6 @@ class TestDatabaseChangeDetection:
             tracker.bills[bill.unique_key] = bill
             tracker._save_database()
 
-            initial_mtime = mock_db_file.stat().st_mtime
-            time.sleep(0.1)  # Ensure time difference
-
             # Make a change
             bill.update(
                 status_code="300",
@@ -721,8 +1219,11 @@ class TestDatabaseChangeDetection:
             # Save again
             tracker._save_database()
 
-            new_mtime = mock_db_file.stat().st_mtime
-            assert new_mtime > initial_mtime
+            with closing(sqlite3.connect(mock_db_file)) as conn:
+                (state_count,) = conn.execute(
+                    "SELECT COUNT(*) FROM bill_states"
+                ).fetchone()
+            assert state_count == 3
 
 
 # ============================================================================
@@ -763,12 +1264,59 @@ class TestUtilityFunctions:
 
     def test_load_bills_no_database(self, temp_dir, monkeypatch):
         """Test loading bills when database doesn't exist."""
-        # Mock the path
-        fake_path = temp_dir / "legislation" / "bills_db.json"
-        monkeypatch.setattr("utils.Path", lambda x: fake_path)
+        monkeypatch.chdir(temp_dir)
 
         bills = load_bills()
         assert bills == []
+        assert database_mtime() is None
+
+    def test_load_bills_reads_tracker_database(self, tracker_db, sample_bill_data):
+        """Test readers get the tracker's SQLite bills in the Bill.to_dict() shape."""
+        older = dict(sample_bill_data, session="43-2", title="Older C-11")
+        save_bills([sample_bill_data, older])
+
+        bills = load_bills()
+
+        assert [bill["session"] for bill in bills] == ["43-2", "44-1"]
+        assert bills[1] == sample_bill_data
+
+    def test_database_mtime_follows_wal_commits(self, tracker_db, sample_bill_data):
+        """Test commits that only reach the -wal file still count as changes."""
+        with patch.object(BillTracker, "_fetch_current_bills_xml", return_value=[]):
+            tracker = BillTracker(fetch_historical=False)
+        tracker._save_database()
+        before = database_mtime()
+
+        time.sleep(0.01)
+        bill = Bill.from_dict(sample_bill_data)
+        tracker.bills[bill.unique_key] = bill
+        tracker._save_database()
+
+        assert Path(f"{tracker_db}-wal").exists()
+        assert database_mtime() > before
+        tracker._db.close()
+
+    def test_bills_db_path_matches_tracker(self):
+        """Test the readers default to the file the tracker writes."""
+        import main
+        import utils
+
+        assert Path(utils.BILLS_DB_PATH) == main.DB_FILE
+
+    def test_bill_shards_round_trip(
+        self, temp_dir, tracker_db, monkeypatch, sample_bill_data
+    ):
+        """Test per-bill shards are built from the database and loaded back."""
+        monkeypatch.chdir(temp_dir)
+        save_bills([sample_bill_data])
+
+        assert bill_shards_current() is False
+        build_bill_shards(load_bills())
+
+        assert bill_shards_current() is True
+        assert load_bill_shard("C-11")["title"] == sample_bill_data["title"]
+        assert load_bill_shard("C-999") is None
+        assert load_bill_shard("../bills_db") is None
 
 
 # ============================================================================
@@ -833,6 +1381,131 @@ class TestBillLookup:
         assert "Broadcasting Act" in captured.out
         assert "44-1" in captured.out
 
+    def test_main_json_output(self, capsys, temp_dir, monkeypatch, sample_bill_data):
+        """Test --json emits raw bill records without display formatting."""
+        import bill_lookup
+
+        monkeypatch.chdir(temp_dir)
+        monkeypatch.setattr(bill_lookup, "load_bills", lambda: [sample_bill_data])
+        monkeypatch.setattr("sys.argv", ["bill_lookup.py", "--json", "c-11", "C-999"])
+
+        bill_lookup.main()
+
+        captured = capsys.readouterr()
+        output = json.loads(captured.out)
+        assert [bill["bill_id"] for bill in output] == ["C-11"]
+        assert "═" not in captured.out
+
+    def test_main_only_uses_daemon_when_requested(
+        self, capsys, temp_dir, monkeypatch, sample_bill_data
+    ):
+        """Test plain lookups never consult a resident daemon."""
+        import bill_lookup
+
+        monkeypatch.chdir(temp_dir)
+        monkeypatch.setattr(bill_lookup, "load_bills", lambda: [sample_bill_data])
+        monkeypatch.setattr("sys.argv", ["bill_lookup.py", "--json", "C-11"])
+
+        with patch.object(bill_lookup, "query_daemon") as mock_query:
+            bill_lookup.main()
+            mock_query.assert_not_called()
+
+    def test_main_builds_shards_only_on_request(
+        self, capsys, temp_dir, tracker_db, monkeypatch, sample_bill_data
+    ):
+        """Test lookups never write shards; --build-shards does, and they're used."""
+        import bill_lookup
+
+        monkeypatch.chdir(temp_dir)
+        save_bills([sample_bill_data])
+
+        monkeypatch.setattr("sys.argv", ["bill_lookup.py", "--json", "C-11"])
+        bill_lookup.main()
+        assert not (temp_dir / "legislation").exists()
+
+        monkeypatch.setattr("sys.argv", ["bill_lookup.py", "--build-shards"])
+        bill_lookup.main()
+        assert bill_shards_current() is True
+        capsys.readouterr()
+
+        monkeypatch.setattr("sys.argv", ["bill_lookup.py", "--json", "C-11"])
+        with patch.object(bill_lookup, "load_bills") as mock_load:
+            bill_lookup.main()
+            mock_load.assert_not_called()
+        assert json.loads(capsys.readouterr().out) == [sample_bill_data]
+
+    def test_daemon_socket_is_per_user_and_per_database(self, temp_dir, monkeypatch):
+        """Test each database directory gets its own socket in the runtime dir."""
+        import bill_lookup_daemon
+
+        monkeypatch.setenv("XDG_RUNTIME_DIR", str(temp_dir))
+        (temp_dir / "a").mkdir()
+        (temp_dir / "b").mkdir()
+
+        monkeypatch.chdir(temp_dir / "a")
+        path_a = bill_lookup_daemon.socket_path()
+        monkeypatch.chdir(temp_dir / "b")
+        path_b = bill_lookup_daemon.socket_path()
+
+        assert path_a.parent == path_b.parent == temp_dir
+        assert path_a != path_b
+
+    def test_daemon_serves_queries_over_socket(
+        self, temp_dir, tracker_db, monkeypatch, sample_bill_data
+    ):
+        """Test a serve()/query_daemon round trip against the tracker database."""
+        import threading
+
+        import bill_lookup_daemon
+
+        monkeypatch.chdir(temp_dir)
+        monkeypatch.setenv("XDG_RUNTIME_DIR", str(temp_dir))
+        monkeypatch.setattr(bill_lookup_daemon, "IDLE_TIMEOUT_SECONDS", 1)
+        # SIGTERM handlers can only be installed from the main thread
+        monkeypatch.setattr(bill_lookup_daemon.signal, "signal", lambda *args: None)
+        save_bills([sample_bill_data])
+
+        server = threading.Thread(target=bill_lookup_daemon.serve)
+        server.start()
+        try:
+            sock_path = bill_lookup_daemon.socket_path()
+            deadline = time.monotonic() + 5
+            while not sock_path.exists() and time.monotonic() < deadline:
+                time.sleep(0.01)
+
+            response = bill_lookup_daemon.query_daemon(["c-11", "C-999"])
+            assert list(response["bills"]) == ["C-11"]
+            assert response["bills"]["C-11"] == sample_bill_data
+            assert response["available"] == ["C-11"]
+
+            # A live daemon's socket is never replaced by a new one
+            with patch.object(bill_lookup_daemon.subprocess, "Popen") as mock_popen:
+                assert bill_lookup_daemon.start_daemon() is True
+                mock_popen.assert_not_called()
+            assert sock_path.exists()
+        finally:
+            server.join(timeout=10)
+
+        assert not server.is_alive()
+        assert not sock_path.exists()  # Removed once idle
+
+    def test_start_daemon_replaces_only_refused_socket(self, temp_dir, monkeypatch):
+        """Test a socket file nobody listens on is cleaned up before spawning."""
+        import socket
+
+        import bill_lookup_daemon
+
+        monkeypatch.chdir(temp_dir)
+        monkeypatch.setenv("XDG_RUNTIME_DIR", str(temp_dir))
+        sock_path = bill_lookup_daemon.socket_path()
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as stale:
+            stale.bind(str(sock_path))  # Bound but never listening
+
+        with patch.object(bill_lookup_daemon.subprocess, "Popen") as mock_popen:
+            assert bill_lookup_daemon.start_daemon(wait_seconds=0) is False
+            mock_popen.assert_called_once()
+        assert not sock_path.exists()
+
 
 # ============================================================================
 # Edge Cases and Error Handling
@@ -861,10 +1534,8 @@ class TestEdgeCases:
     </Bill>
 </Bills>"""
 
-        with patch("requests.get") as mock_get:
-            mock_response = MagicMock()
-            mock_response.content = incomplete_xml.encode()
-            mock_response.raise_for_status = MagicMock()
+        with patch("requests.Session.get") as mock_get:
+            mock_response = make_xml_response(incomplete_xml)
             mock_get.return_value = mock_response
 
             with patch.object(BillTracker, "_load_database"):
@@ -899,10 +1570,10 @@ class TestEdgeCases:
             for t in threads:
                 t.join()
 
-            # Database should still be valid JSON
-            with open(mock_db_file, "r") as f:
-                data = json.load(f)  # Should not raise
-                assert len(data["bills"]) == 10
+            # Every bill should be stored exactly once
+            with closing(sqlite3.connect(mock_db_file)) as conn:
+                (count,) = conn.execute("SELECT COUNT(*) FROM bills").fetchone()
+                assert count == 10
 
 
 # ============================================================================
@@ -998,11 +1669,15 @@ class TestIntegration:
             tracker._save_database()
 
             # Verify persistence
-            with open(mock_db_file, "r") as f:
-                data = json.load(f)
-                saved_bill = data["bills"][0]
-                assert len(saved_bill["history"]) == 7
-                assert saved_bill["current_stage"] == "ROYAL_ASSENT"
+            with closing(sqlite3.connect(mock_db_file)) as conn:
+                (state_count,) = conn.execute(
+                    "SELECT COUNT(*) FROM bill_states"
+                ).fetchone()
+                (current_stage,) = conn.execute(
+                    "SELECT current_stage FROM bills"
+                ).fetchone()
+                assert state_count == 7
+                assert current_stage == "ROYAL_ASSENT"
 
 
 if __name__ == "__main__":
@@ -3,38 +3,148 @@ Shared utility functions for legislative bill analysis tools.
 """
 
 import json
+import os
+import sqlite3
+from contextlib import closing
+from datetime import date, datetime
+from functools import lru_cache
 from pathlib import Path
-from datetime import datetime
-from typing import List
+from typing import List, Optional
+
+# BillTracker's SQLite database (main.DB_FILE)
+BILLS_DB_PATH = "assets/bills.sqlite"
+# Stored as INTEGER 0/1 in the bills table
+_BOOL_BILL_COLUMNS = ("has_royal_recommendation", "is_active", "died_on_order_paper")
+# One file per bill_id, built from the database by bill_lookup.py --build-shards
+BILL_SHARD_DIR = "legislation/bills"
+_SHARD_MARKER = ".built"
 
 
 def load_bills() -> List[dict]:
-    """Load bills from the database."""
-    db_file = Path("legislation/bills_db.json")
+    """Load bills from the tracker's database, in the Bill.to_dict() shape.
+
+    Bills come in session order, so an index keyed by bill_id keeps the
+    newest session's bill.
+    """
+    db_file = Path(BILLS_DB_PATH)
 
     if not db_file.exists():
         print("No database found. Run main.py first to fetch bills.")
         return []
 
-    with open(db_file, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    # Read-only, so closing never checkpoints (and rewrites) the tracker's WAL
+    uri = db_file.resolve().as_uri() + "?mode=ro"
+    with closing(sqlite3.connect(uri, uri=True)) as conn:
+        conn.row_factory = sqlite3.Row
+
+        histories = {}
+        for row in conn.execute("SELECT * FROM bill_states ORDER BY unique_key, seq"):
+            state = dict(row)
+            unique_key = state.pop("unique_key")
+            del state["seq"]
+            # Epoch seconds in the table, ISO 8601 local time in records
+            timestamp = state["timestamp"]
+            if timestamp is not None:
+                state["timestamp"] = datetime.fromtimestamp(timestamp).isoformat()
+            state["text_changed"] = bool(state["text_changed"])
+            histories.setdefault(unique_key, []).append(state)
+
+        bills = []
+        for row in conn.execute(
+            "SELECT * FROM bills ORDER BY CAST(session AS INTEGER), session, bill_id"
+        ):
+            bill = dict(row)
+            unique_key = bill.pop("unique_key")
+            for column in _BOOL_BILL_COLUMNS:
+                bill[column] = bool(bill[column])
+            bill["history"] = histories.get(unique_key, [])
+            bills.append(bill)
+
+    return bills
+
+
+def database_mtime() -> Optional[float]:
+    """Last time the bill database changed, or None if it doesn't exist.
+
+    The tracker runs SQLite in WAL mode, where commits only touch the -wal
+    file and the main file changes at checkpoints, so both are checked.
+    """
+    mtimes = []
+    for suffix in ("", "-wal"):
+        try:
+            mtimes.append(os.stat(BILLS_DB_PATH + suffix).st_mtime)
+        except OSError:
+            if not suffix:
+                return None
+    return max(mtimes)
+
+
+def bill_shards_current() -> bool:
+    """Check whether the per-bill shards were built from the current database."""
+    db_mtime = database_mtime()
+    if db_mtime is None:
+        return False
+    try:
+        marker_mtime = (Path(BILL_SHARD_DIR) / _SHARD_MARKER).stat().st_mtime
+    except OSError:
+        return False
+    return marker_mtime >= db_mtime
+
+
+def build_bill_shards(bills: List[dict]) -> None:
+    """Write one JSON file per bill_id so later lookups can skip the full load.
+
+    Like the lookup tool's bill_id index, the last bill with a given ID wins.
+    """
+    if not Path(BILLS_DB_PATH).exists():
+        return
 
-    return data.get("bills", [])
+    shard_dir = Path(BILL_SHARD_DIR)
+    shard_dir.mkdir(parents=True, exist_ok=True)
+
+    latest = {bill["bill_id"]: bill for bill in bills}
+    for bill_id, bill in latest.items():
+        with open(shard_dir / f"{bill_id}.json", "w", encoding="utf-8") as f:
+            json.dump(bill, f, ensure_ascii=False)
+
+    # Written last so a partially built shard set is never treated as current
+    (shard_dir / _SHARD_MARKER).touch()
+
+
+def load_bill_shard(bill_id: str) -> Optional[dict]:
+    """Load a single bill from its shard, or None if it isn't in the database."""
+    if not bill_id or Path(bill_id).name != bill_id or bill_id.startswith("."):
+        return None  # Refuse anything that could escape the shard directory
+
+    shard_file = Path(BILL_SHARD_DIR) / f"{bill_id}.json"
+    try:
+        with open(shard_file, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+def list_bill_shards() -> List[str]:
+    """Bill IDs available as shards."""
+    return [path.stem for path in Path(BILL_SHARD_DIR).glob("*.json")]
+
+
+@lru_cache(maxsize=8192)
+def _date_ordinal(date_str: str) -> Optional[int]:
+    """Proleptic ordinal of the date part of an ISO date/datetime string."""
+    try:
+        # Date part is always the first 10 chars ("YYYY-MM-DD"), with or
+        # without a trailing time/timezone
+        return date.fromisoformat(date_str[:10]).toordinal()
+    except (ValueError, TypeError):
+        return None
 
 
 def calculate_days_since(date_str: str) -> int:
     """Calculate days since a given date."""
     if not date_str:
         return None
-    try:
-        # Parse ISO format datetime (may include timezone)
-        if "T" in date_str:
-            date_part = date_str.split("T")[0]
-            last_date = datetime.fromisoformat(date_part)
-        else:
-            last_date = datetime.fromisoformat(date_str)
-
-        days = (datetime.now() - last_date).days
-        return days
-    except:
+    ordinal = _date_ordinal(date_str)
+    if ordinal is None:
         return None
+    return date.today().toordinal() - ordinal
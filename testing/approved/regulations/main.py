@@ -41,6 +41,12 @@ PARSABLE_SECTIONS = [
     "Miscellaneous Notices",
     "Parliament",
 ]
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/87.0.4280.88 Safari/537.36"
+
+# Shared HTTP session so index/issue requests (including those from the
+# scraping threads) reuse keep-alive connections across scraping cycles
+HTTP_SESSION = requests.Session()
+HTTP_SESSION.headers["User-Agent"] = USER_AGENT
 
 
 def ensure_assets_directory():
@@ -50,6 +56,31 @@ def ensure_assets_directory():
         print(f"Created directory: {ASSETS_DIR}")
 
 
+def write_json_atomic(path: str, data):
+    """
+    Write data as JSON to path via a temp file and os.replace.
+
+    A crash mid-write leaves the previous file intact instead of a truncated
+    one that would fail to load (and trigger a full re-scrape). The data is
+    fsynced before the rename so a power loss can't surface an empty file,
+    and the temp file is removed if writing fails.
+
+    Args:
+        path: Destination file path
+        data: JSON-serializable data
+    """
+    tmp_path = f"{path}.tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
 def load_status():
     """
     Load the db_status.json file.
@@ -89,8 +120,7 @@ def save_status(status_data: dict):
     status_file = os.path.join(ASSETS_DIR, "db_status.json")
 
     try:
-        with open(status_file, "w", encoding="utf-8") as f:
-            json.dump(status_data, f, ensure_ascii=False, indent=2)
+        write_json_atomic(status_file, status_data)
         print(f"Updated status file: {status_file}")
     except Exception as e:
         print(f"Error saving status file: {e}")
@@ -134,10 +164,7 @@ def check_year_exists(year: int, part: int) -> bool:
     index_url = f"https://gazette.gc.ca/rp-pr/p{part}/{year}/index-eng.html"
 
     try:
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/87.0.4280.88 Safari/537.36"
-        }
-        response = requests.get(index_url, headers=headers, timeout=30)
+        response = HTTP_SESSION.get(index_url, timeout=30)
         return response.status_code == 200
     except Exception:
         return False
@@ -157,10 +184,7 @@ def get_all_issue_urls(year: int, part: int) -> list:
     index_url = f"https://gazette.gc.ca/rp-pr/p{part}/{year}/index-eng.html"
 
     try:
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/87.0.4280.88 Safari/537.36"
-        }
-        response = requests.get(index_url, headers=headers, timeout=30)
+        response = HTTP_SESSION.get(index_url, timeout=30)
         response.raise_for_status()
 
         soup = BeautifulSoup(response.content, "html.parser")
@@ -215,10 +239,7 @@ def extract_publication_date_from_url(url: str) -> str:
 
     # Otherwise try to fetch and parse the page
     try:
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/87.0.4280.88 Safari/537.36"
-        }
-        response = requests.get(url, headers=headers, timeout=30)
+        response = HTTP_SESSION.get(url, timeout=30)
         soup = BeautifulSoup(response.content, "html.parser")
 
         # Look for h1 with id="wb-cont" and get the next <p> tag
@@ -366,8 +387,7 @@ def save_data(part_num: int, data_dict: dict):
     """
     filename = os.path.join(ASSETS_DIR, f"part{part_num}_data.json")
     try:
-        with open(filename, "w", encoding="utf-8") as f:
-            json.dump(data_dict, f, ensure_ascii=False, indent=2)
+        write_json_atomic(filename, data_dict)
         print(
             f"Saved Part {part_num} data to {filename} ({len(data_dict)} publication dates)"
         )
@@ -490,8 +510,7 @@ def update_status_file(publication_date: str, entry_counts: dict):
     }
 
     try:
-        with open(status_file, "w", encoding="utf-8") as f:
-            json.dump(status_data, f, ensure_ascii=False, indent=2)
+        write_json_atomic(status_file, status_data)
         print(f"Updated status file: {status_file}")
     except Exception as e:
         print(f"Error updating status file: {e}")
@@ -517,38 +536,46 @@ def run_scraping_cycle():
     status = load_status()
     status_lock = threading.Lock()
 
-    # Process each part
+    # Load existing data for every part
+    existing_by_part = {}
     for part in [1, 2, 3]:
-        print(f"\n{'=' * 60}")
-        print(f"Processing Part {part}")
-        print(f"{'=' * 60}")
+        existing_by_part[part] = load_existing_data(part)
+        print(
+            f"Loaded {len(existing_by_part[part])} existing publication dates for Part {part}"
+        )
 
-        # Load existing data for this part
-        existing_data = load_existing_data(part)
-        print(f"Loaded {len(existing_data)} existing publication dates for Part {part}")
+    # Process each year from START_YEAR to current_year for all three parts on
+    # one ThreadPoolExecutor, so the parts' (mostly network-bound) work overlaps
+    # instead of each part waiting for the previous one's slowest year
+    print(f"\n{'=' * 60}")
+    print("Processing Parts 1-3")
+    print(f"{'=' * 60}")
 
-        # Process each year from START_YEAR to current_year using ThreadPoolExecutor
-        future_to_year = {}
-        with concurrent.futures.ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+    future_to_job = {}
+    with concurrent.futures.ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        for part in [1, 2, 3]:
             for year in range(START_YEAR, current_year + 1):
                 future = executor.submit(
                     process_year_for_part, year, part, status, status_lock
                 )
-                future_to_year[future] = year
+                future_to_job[future] = (part, year)
 
-            # Collect results as they complete
-            for future in concurrent.futures.as_completed(future_to_year):
-                year = future_to_year[future]
-                try:
-                    year_data = future.result()
+        # Collect results as they complete
+        for future in concurrent.futures.as_completed(future_to_job):
+            part, year = future_to_job[future]
+            try:
+                year_data = future.result()
 
-                    # Merge new data into existing data (thread-safe in main thread)
-                    if year_data:
-                        existing_data.update(year_data)
+                # Merge new data into existing data (thread-safe in main thread)
+                if year_data:
+                    existing_by_part[part].update(year_data)
 
-                except Exception as e:
-                    print(f"Error processing Part {part}, Year {year}: {e}")
-                    traceback.print_exc()
+            except Exception as e:
+                print(f"Error processing Part {part}, Year {year}: {e}")
+                traceback.print_exc()
+
+    for part in [1, 2, 3]:
+        existing_data = existing_by_part[part]
 
         # Save updated data for this part
         save_data(part, existing_data)
@@ -564,7 +591,7 @@ def run_scraping_cycle():
     # Find the most recent publication date across all parts
     latest_date = "Unknown"
     for part in [1, 2, 3]:
-        data = load_existing_data(part)
+        data = existing_by_part[part]
         if data:
             # Get the most recent date key
             dates = sorted(data.keys(), reverse=True)